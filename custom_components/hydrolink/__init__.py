@@ -47,21 +47,25 @@ See LICENSE file in the project root for full license information.
 """
 from __future__ import annotations
 
+import logging
+
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.const import Platform
-from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import entity_registry as er
 
-from .const import DOMAIN
+from .const import BINARY_SENSOR_PROPERTIES, DOMAIN
 
 # Since we use config flow, this is an empty schema
 CONFIG_SCHEMA = vol.Schema({DOMAIN: vol.Schema({})}, extra=vol.ALLOW_EXTRA)
 from .coordinator import HydroLinkDataUpdateCoordinator
 from .services import async_setup_services
 
-PLATFORMS = [Platform.SENSOR]
+_LOGGER = logging.getLogger(__name__)
+
+PLATFORMS = [Platform.BINARY_SENSOR, Platform.SENSOR]
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the HydroLink component."""
@@ -69,12 +73,33 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     return True
 
 
+def _async_remove_legacy_sensor_entities(
+    hass: HomeAssistant, coordinator: HydroLinkDataUpdateCoordinator
+) -> None:
+    """Remove sensor entities of properties now exposed as binary sensors.
+
+    The binary sensors keep the same unique IDs, so without this the old
+    sensor registry entries would stay behind as unavailable orphans.
+    """
+    ent_reg = er.async_get(hass)
+    for device in coordinator.data or []:
+        if "id" not in device:
+            continue
+        for prop_name in BINARY_SENSOR_PROPERTIES:
+            entity_id = ent_reg.async_get_entity_id(
+                Platform.SENSOR, DOMAIN, f"hydrolink_{device['id']}_{prop_name}"
+            )
+            if entity_id is not None:
+                _LOGGER.info("Removing %s, now provided as a binary sensor", entity_id)
+                ent_reg.async_remove(entity_id)
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up HydroLink from a config entry.
 
     This function is called when a config entry is created for the integration.
     It initializes the data coordinator and forwards the setup to the sensor
-    platform.
+    and binary sensor platforms.
 
     Args:
         hass: The Home Assistant instance.
@@ -93,7 +118,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Store the coordinator in the hass data
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
-    # Forward the setup to the sensor platform
+    # Drop registry entries left from when on/off properties were sensors
+    _async_remove_legacy_sensor_entities(hass, coordinator)
+
+    # Forward the setup to the sensor and binary sensor platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     
     # Set up services
@@ -106,7 +134,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry.
 
     This function is called when a config entry is removed. It unloads the
-    sensor platform and removes the coordinator from the hass data.
+    sensor platform, removes the coordinator from the hass data and closes
+    its API session.
 
     Args:
         hass: The Home Assistant instance.
@@ -118,7 +147,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Unload the platforms associated with the config entry
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        # Remove the coordinator from the hass data
-        hass.data[DOMAIN].pop(entry.entry_id)
+        # Remove the coordinator from the hass data and close its HTTP session
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await hass.async_add_executor_job(coordinator.api.close)
 
     return unload_ok
@@ -76,14 +76,16 @@ Example Usage:
 """
 
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 import json
 import logging
 import requests
-import websocket
 import threading
 import time
 
+if TYPE_CHECKING:
+    import websocket
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -123,6 +125,25 @@ class HydroLinkApi:
         self.ws_message_count: int = 0
         self.waiting_for_ws_thread_to_end: int = 1
         self.ws_uri: str = ""
+        # One session for all REST calls so the HTTPS connection is reused.
+        # Calls arrive from different executor threads, so access is serialized.
+        self._session: requests.Session = requests.Session()
+        self._session_lock: threading.Lock = threading.Lock()
+
+    def _get(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a GET request through the shared session."""
+        with self._session_lock:
+            return self._session.get(url, **kwargs)
+
+    def _post(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a POST request through the shared session."""
+        with self._session_lock:
+            return self._session.post(url, **kwargs)
+
+    def close(self) -> None:
+        """Close the shared session and release its pooled connections."""
+        with self._session_lock:
+            self._session.close()
 
     def login(self) -> bool:
         """Authenticate with the HydroLink API.
@@ -143,7 +164,7 @@ class HydroLinkApi:
             True
         """
         try:
-            response = requests.post(
+            response = self._post(
                 f"{self.BASE_URL}/auth/login",
                 json={
                     "email": self.email,
@@ -192,6 +213,9 @@ class HydroLinkApi:
             The web app closes the connection after 17 messages, so we follow
             the same pattern to maintain compatibility.
         """
+        # Imported here so websocket-client only loads in the refresh thread
+        import websocket
+
         def on_message(ws: websocket.WebSocketApp, message: str) -> None:
             """Handle incoming WebSocket messages.
             
@@ -301,7 +325,7 @@ class HydroLinkApi:
 
         try:
             # Get the list of devices
-            response = requests.get(
+            response = self._get(
                 f"{self.BASE_URL}/devices",
                 params={"all": "false", "per_page": "200"},
                 cookies={"hhfoffoezyzzoeibwv": self.auth_cookie},
@@ -325,7 +349,7 @@ class HydroLinkApi:
                         continue
 
                     # Get the WebSocket URI for the device
-                    response = requests.get(
+                    response = self._get(
                         f"{self.BASE_URL}/devices/{device_id}/live",
                         cookies={"hhfoffoezyzzoeibwv": self.auth_cookie},
                         timeout=10,
@@ -376,7 +400,7 @@ class HydroLinkApi:
                     )
 
             # Fetch fresh data for all devices
-            response = requests.get(
+            response = self._get(
                 f"{self.BASE_URL}/devices",
                 params={"all": "false", "per_page": "200"},
                 cookies={"hhfoffoezyzzoeibwv": self.auth_cookie},
@@ -410,7 +434,7 @@ class HydroLinkApi:
             self.login()
             
         try:
-            response = requests.post(
+            response = self._post(
                 f"{self.BASE_URL}/devices/{device_id}/regenerate",
                 cookies={"hhfoffoezyzzoeibwv": self.auth_cookie},
                 timeout=10
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""
+EcoWater HydroLink Binary Sensor Platform for Home Assistant
+
+Exposes the on/off properties of EcoWater HydroLink water softeners, such as
+connectivity, vacation mode and the maintenance alerts, as binary sensors.
+Every other API property is handled by the sensor platform.
+
+Key Features:
+- Connectivity, problem and moisture device classes for alerts
+- Alert values reported as 0/1, booleans or text are all mapped to on/off
+- Shares unique IDs, device info and update handling with the sensor platform
+
+License: MIT
+See LICENSE file in the project root for full license information.
+"""
+
+import logging
+from types import MappingProxyType
+from typing import NamedTuple, Optional
+
+from homeassistant.components.binary_sensor import (
+    BinarySensorDeviceClass,
+    BinarySensorEntity,
+)
+
+from .const import (
+    BINARY_SENSOR_PROPERTIES,
+    DEFAULT_ENABLED_SENSORS,
+    DOMAIN,
+    SensorCategory,
+)
+from .entity import HydroLinkEntity, _entity_name, softener_devices
+
+_LOGGER = logging.getLogger(__name__)
+
+# Text values the API uses for an inactive flag; any other text is "on"
+_FALSE_STRINGS = frozenset({"", "0", "false", "off", "no", "none"})
+
+
+class BinarySensorDesc(NamedTuple):
+    """Static metadata describing how a HydroLink on/off property is exposed."""
+
+    name: str
+    device_class: Optional[BinarySensorDeviceClass]
+    icon: Optional[str]
+    category: SensorCategory
+
+
+# Descriptions for each binary sensor
+BINARY_SENSOR_DESCRIPTIONS = MappingProxyType({
+    # BASIC SYSTEM INFORMATION
+    "_internal_is_online": BinarySensorDesc(
+        name="Online Status",
+        device_class=BinarySensorDeviceClass.CONNECTIVITY,
+        icon=None,
+        category=SensorCategory.BASIC,
+    ),
+    "app_active": BinarySensorDesc(
+        name="App Active",
+        device_class=None,
+        icon="mdi:checkbox-marked-circle",
+        category=SensorCategory.BASIC,
+    ),
+    "vacation_mode": BinarySensorDesc(
+        name="Vacation Mode",
+        device_class=None,
+        icon="mdi:airplane",
+        category=SensorCategory.BASIC,
+    ),
+
+    # ALERTS
+    "low_salt_alert": BinarySensorDesc(
+        name="Low Salt Alert",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        icon=None,
+        category=SensorCategory.ALERTS,
+    ),
+    "error_code_alert": BinarySensorDesc(
+        name="Error Code Alert",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        icon=None,
+        category=SensorCategory.ALERTS,
+    ),
+    "flow_monitor_alert": BinarySensorDesc(
+        name="Flow Monitor Alert",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        icon=None,
+        category=SensorCategory.ALERTS,
+    ),
+    "excessive_water_use_alert": BinarySensorDesc(
+        name="Excessive Water Use Alert",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        icon=None,
+        category=SensorCategory.ALERTS,
+    ),
+    "floor_leak_detector_alert": BinarySensorDesc(
+        name="Leak Detector Alert",
+        device_class=BinarySensorDeviceClass.MOISTURE,
+        icon=None,
+        category=SensorCategory.ALERTS,
+    ),
+    "service_reminder_alert": BinarySensorDesc(
+        name="Service Reminder Alert",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        icon=None,
+        category=SensorCategory.ALERTS,
+    ),
+})
+
+
+def _to_bool(value) -> Optional[bool]:
+    """Map a raw API flag value to on/off, or None when it is unknown."""
+    if value is None or value == "unknown":
+        return None
+    if type(value) is str:
+        return value.strip().lower() not in _FALSE_STRINGS
+    return bool(value)
+
+
+async def async_setup_entry(hass, entry, async_add_entities):
+    """Set up the HydroLink binary sensors from a config entry."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+
+    entities = [
+        HydroLinkBinarySensor(
+            coordinator,
+            device["id"],
+            prop_name,
+            device.get("nickname", "EcoWater Softener"),
+        )
+        for device in softener_devices(coordinator.data)
+        for prop_name, prop_info in device["properties"].items()
+        if prop_name in BINARY_SENSOR_PROPERTIES
+        and type(prop_info) is dict
+        and "value" in prop_info
+    ]
+
+    _LOGGER.info("Created %d HydroLink binary sensor entities", len(entities))
+    async_add_entities(entities)
+
+
+class HydroLinkBinarySensor(HydroLinkEntity, BinarySensorEntity):
+    """Representation of a HydroLink binary sensor."""
+
+    def __init__(self, coordinator, device_id, property_name, device_name):
+        """Initialize the binary sensor."""
+        super().__init__(coordinator, device_id, property_name, device_name)
+        description = BINARY_SENSOR_DESCRIPTIONS[property_name]
+        self._attr_name = _entity_name(device_name, description.name)
+        self._attr_entity_registry_enabled_default = (
+            property_name in DEFAULT_ENABLED_SENSORS
+        )
+        self._attr_device_class = description.device_class
+        if description.icon:
+            self._attr_icon = description.icon
+        self._update_value()
+
+    def _apply_value(self, value):
+        """Store the raw flag value as the on/off state."""
+        self._attr_is_on = is_on = _to_bool(value)
+        return is_on
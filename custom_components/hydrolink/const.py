@@ -23,6 +23,8 @@ License: MIT
 See LICENSE file in the project root for full license information.
 """
 
+from enum import IntFlag
+
 DOMAIN = "hydrolink"
 DEFAULT_UPDATE_INTERVAL = 300  # 5 minutes in seconds
 
@@ -30,7 +32,110 @@ DEFAULT_UPDATE_INTERVAL = 300  # 5 minutes in seconds
 DOMAIN = "hydrolink"
 
 # The platforms to be set up
-PLATFORMS = ["sensor"]
+PLATFORMS = ["binary_sensor", "sensor"]
 
 # Services
 SERVICE_TRIGGER_REGENERATION = "trigger_regeneration"
+
+# On/off properties exposed by the binary sensor platform instead of the sensor
+# platform. Releases before the split registered them as sensors.
+BINARY_SENSOR_PROPERTIES = frozenset({
+    "_internal_is_online",
+    "app_active",
+    "vacation_mode",
+    "low_salt_alert",
+    "error_code_alert",
+    "flow_monitor_alert",
+    "excessive_water_use_alert",
+    "floor_leak_detector_alert",
+    "service_reminder_alert",
+})
+
+# Properties whose entities are enabled by default, shared by the sensor and
+# binary sensor platforms
+DEFAULT_ENABLED_SENSORS = frozenset({
+    # Basic Status and System Information
+    "_internal_is_online",              # Device online status
+    "app_active",                       # Application active status
+    "current_time_secs",                # Current device time
+    "model_description",                # Model description (EWS ERRC3702R50)
+    "nickname",                         # Device nickname
+
+    # Water Usage and Flow Metrics (Imperial)
+    "current_water_flow_gpm",           # Current water flow in GPM
+    "gallons_used_today",              # Water used today in gallons
+    "avg_daily_use_gals",              # Average daily usage in gallons
+    "total_outlet_water_gals",         # Total treated water in gallons
+    "peak_water_flow_gpm",             # Peak water flow in GPM
+    "treated_water_avail_gals",        # Available treated water in gallons
+
+    # Salt Management
+    "salt_level_tenths",               # Current salt level in tenths (API value / 10 = %)
+    "out_of_salt_estimate_days",       # Days until salt needed
+    "avg_salt_per_regen_lbs",          # Average salt per regeneration (lbs)
+    "total_salt_use_lbs",              # Total salt used (lbs)
+
+    # System Performance
+    "capacity_remaining_percent",       # Remaining capacity percentage
+    "operating_capacity_grains",        # Operating capacity in grains
+    "hardness_grains",                 # Water hardness in grains
+    "rock_removed_since_rech_lbs",     # Hardness removed since recharge (lbs)
+    "daily_avg_rock_removed_lbs",      # Daily average hardness removed (lbs)
+    "total_rock_removed_lbs",          # Total hardness removed (lbs)
+
+    # Regeneration Status
+    "regen_status_enum",               # Current regeneration status
+    "days_since_last_regen",           # Days since last regeneration
+    "total_regens",                    # Total regeneration count
+    "manual_regens",                   # Manual regeneration count
+    "regen_time_rem_secs",             # Remaining regeneration time
+
+    # Critical Alerts
+    "low_salt_alert",                  # Low salt warning
+    "error_code_alert",                # System error alert
+    "flow_monitor_alert",              # Flow monitoring alert
+    "excessive_water_use_alert",       # High water usage alert
+    "floor_leak_detector_alert",       # Leak detection alert
+    "service_reminder_alert",          # Service reminder alert
+
+    # Signal and Connection
+    "rf_signal_strength_dbm",          # WiFi signal strength
+    "rf_signal_bars",                  # WiFi signal quality
+
+    # System Stats
+    "days_in_operation",               # Total days system has been running
+    "power_outage_count",              # Number of power outages
+    "service_reminder_months",         # Months until service needed
+    "time_lost_events",                # Time lost events count
+
+    # Additional sensors enabled for debugging/inspection
+    "iron_level_tenths_ppm",           # Iron level in water
+    "tlc_avg_temp_tenths_c",           # TLC average temperature
+    "salt_effic_grains_per_lb",        # Salt efficiency
+    "salt_type_enum",                  # Salt type
+    "water_counter_gals",              # Water counter
+    "error_code",                      # Error code number
+    "service_active",                  # Service mode active
+    "product_serial_number",           # Device serial number
+    "location",                        # Device location
+    "system_type",                     # System type
+    "model_display_code",              # Model display code
+    "base_software_version",           # Base software version
+    "esp_software_part_number",        # ESP software part number
+    "regen_time_secs",                 # Regeneration time setting
+    "system_error",                    # System error status
+    "vacation_mode",                   # Vacation mode status
+})
+
+
+class SensorCategory(IntFlag):
+    """Sensor groups, as bit flags so several can be matched at once."""
+
+    BASIC = 1
+    WATER = 2
+    SALT = 4
+    REGEN = 8
+    PERFORMANCE = 16
+    MAINTENANCE = 32
+    ALERTS = 64
+    SYSTEM = 128
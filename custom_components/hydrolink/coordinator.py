@@ -56,6 +56,7 @@ from datetime import timedelta
 import logging
 
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
 
@@ -65,6 +66,26 @@ from .const import DOMAIN
 _LOGGER = logging.getLogger(__name__)
 
 
+def index_property_values(data):
+    """Flatten device data into a {(device_id, property_name): value} dict.
+
+    Built once per fetch so every sensor resolves its value with a single
+    dict lookup instead of walking the device and property dicts itself.
+    Devices without an ID are logged and skipped.
+    """
+    values = {}
+    for device in data:
+        device_id = device.get("id")
+        if device_id is None:
+            _LOGGER.warning("Skipping HydroLink device without an ID: %s", device)
+            continue
+        # The API sends "properties": null for devices that have not reported yet
+        for prop_name, prop_info in (device.get("properties") or {}).items():
+            if type(prop_info) is dict:
+                values[(device_id, prop_name)] = prop_info.get("value")
+    return values
+
+
 class HydroLinkDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching HydroLink data from the API."""
 
@@ -79,6 +100,10 @@ class HydroLinkDataUpdateCoordinator(DataUpdateCoordinator):
             entry.data[CONF_EMAIL],
             entry.data[CONF_PASSWORD],
         )
+        # Property values from the latest fetch keyed by (device ID, property)
+        self.values = {}
+        # Log in on the first update and again after the session is rejected
+        self._logged_in = False
         # Initialize the DataUpdateCoordinator
         super().__init__(
             hass,
@@ -86,6 +111,8 @@ class HydroLinkDataUpdateCoordinator(DataUpdateCoordinator):
             name=DOMAIN,
             update_interval=timedelta(minutes=5),
         )
+        # Older cores only pick the entry up from the setup context
+        self.config_entry = entry
 
     async def _async_update_data(self):
         """Fetch data from the API endpoint.
@@ -98,13 +125,22 @@ class HydroLinkDataUpdateCoordinator(DataUpdateCoordinator):
             The latest data from the API.
 
         Raises:
-            UpdateFailed: If the API call fails due to authentication or
-                connection issues.
+            ConfigEntryAuthFailed: If the credentials are rejected.
+            UpdateFailed: If the API call fails for any other reason.
         """
         try:
+            if not self._logged_in:
+                await self.hass.async_add_executor_job(self.api.login)
+                self._logged_in = True
             # Fetch the data from the API
-            return await self.hass.async_add_executor_job(self.api.get_data)
+            data = await self.hass.async_add_executor_job(self.api.get_data)
         except InvalidAuth as err:
-            raise UpdateFailed("Invalid authentication") from err
+            self._logged_in = False
+            raise ConfigEntryAuthFailed("Invalid authentication") from err
         except CannotConnect as err:
             raise UpdateFailed("Error communicating with API") from err
+        except Exception as err:
+            raise UpdateFailed(f"Unexpected error: {err}") from err
+
+        self.values = index_property_values(data)
+        return data
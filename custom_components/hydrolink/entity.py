@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+EcoWater HydroLink Base Entity
+
+Shared base class for the entity platforms of the HydroLink integration. Each
+entity exposes one API property of one softener and reads its value from the
+coordinator's flattened (device ID, property) index.
+
+Key Features:
+- Stable unique IDs and device info shared by every platform
+- Values refreshed once per coordinator update
+- State only written when the value or availability actually changed
+
+License: MIT
+See LICENSE file in the project root for full license information.
+"""
+
+import sys
+from abc import abstractmethod
+from functools import lru_cache
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN
+
+# Marker for "no state written yet" so the first update always goes out
+_UNSET = object()
+
+# Device info dicts, one per device shared by all of its entities. Home
+# Assistant only reads these, so handing out the same dict is safe. Bounded so
+# devices that were removed or renamed do not pin their entries forever.
+@lru_cache(maxsize=64)
+def _device_info(device_id: str, device_name: str) -> dict:
+    """Return the shared device info dict for a device."""
+    return {
+        "identifiers": {(DOMAIN, device_id)},
+        "name": device_name,
+        "manufacturer": "EcoWater",
+    }
+
+
+# Display names keyed by (device name, name suffix), interned so every entity
+# of the same kind shares one string. Sized for a few softeners' properties.
+@lru_cache(maxsize=1024)
+def _entity_name(device_name: str, suffix: str) -> str:
+    """Return the interned display name for a device property."""
+    return sys.intern(f"{device_name} {suffix}")
+
+
+def softener_devices(data):
+    """Return the demand softeners in coordinator data that report properties."""
+    return [
+        device for device in data
+        if device.get("system_type") == "demand_softener" and device.get("properties")
+    ]
+
+
+class HydroLinkEntity(CoordinatorEntity):
+    """Base class for entities backed by a single HydroLink device property."""
+
+    def __init__(self, coordinator, device_id, property_name, device_name):
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self._device_id = device_id
+        self._property_name = property_name
+        self._device_name = device_name
+        self._value_key = (device_id, property_name)
+        self._last_state = _UNSET
+
+        self._attr_unique_id = sys.intern(f"hydrolink_{device_id}_{property_name}")
+        self._attr_device_info = _device_info(device_id, device_name)
+
+    def _update_value(self):
+        """Refresh the entity's state attribute from the latest coordinator data."""
+        # Devices and properties can drop out of the payload between refreshes
+        return self._apply_value(self.coordinator.values.get(self._value_key))
+
+    @abstractmethod
+    def _apply_value(self, value):
+        """Convert a raw API value, store it as the entity's state and return it."""
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator.
+
+        The value is converted once per coordinator tick and stored on the
+        entity. Most HydroLink properties are static between refreshes, so only
+        write state when the value or availability actually changed instead of
+        writing every entity on every coordinator tick.
+        """
+        state = (self.available, self._update_value())
+        if state == self._last_state:
+            return
+        self._last_state = state
+        super()._handle_coordinator_update()
@@ -69,6 +69,11 @@ License: MIT
 See LICENSE file in the project root for full license information.
 """
 
+import logging
+from functools import lru_cache
+from types import MappingProxyType
+from typing import NamedTuple, Optional
+
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
@@ -82,653 +87,579 @@ from homeassistant.const import (
     UnitOfMass,
     SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
 )
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import (
+    BINARY_SENSOR_PROPERTIES,
+    DEFAULT_ENABLED_SENSORS,
+    DOMAIN,
+    SensorCategory,
+)
+from .entity import HydroLinkEntity, _entity_name, softener_devices
+
+_LOGGER = logging.getLogger(__name__)
 
 # All available sensor categories
-SENSOR_CATEGORIES = {
-    "BASIC": "Basic system information",
-    "WATER": "Water usage and flow metrics",
-    "SALT": "Salt level and usage metrics",
-    "REGEN": "Regeneration information",
-    "PERFORMANCE": "System performance metrics",
-    "MAINTENANCE": "Maintenance and service information",
-    "ALERTS": "System alerts and warnings",
-    "SYSTEM": "System status and configuration"
-}
-
-# Set of sensors to be enabled by default
-DEFAULT_ENABLED_SENSORS = {
-    # Basic Status and System Information
-    "_internal_is_online",              # Device online status
-    "app_active",                       # Application active status
-    "current_time_secs",                # Current device time
-    "model_description",                # Model description (EWS ERRC3702R50)
-    "nickname",                         # Device nickname
-
-    # Water Usage and Flow Metrics (Imperial)
-    "current_water_flow_gpm",           # Current water flow in GPM
-    "gallons_used_today",              # Water used today in gallons
-    "avg_daily_use_gals",              # Average daily usage in gallons
-    "total_outlet_water_gals",         # Total treated water in gallons
-    "peak_water_flow_gpm",             # Peak water flow in GPM
-    "treated_water_avail_gals",        # Available treated water in gallons
-
-    # Salt Management
-    "salt_level_tenths",               # Current salt level in tenths (API value / 10 = %)
-    "out_of_salt_estimate_days",       # Days until salt needed
-    "avg_salt_per_regen_lbs",          # Average salt per regeneration (lbs)
-    "total_salt_use_lbs",              # Total salt used (lbs)
-
-    # System Performance
-    "capacity_remaining_percent",       # Remaining capacity percentage
-    "operating_capacity_grains",        # Operating capacity in grains
-    "hardness_grains",                 # Water hardness in grains
-    "rock_removed_since_rech_lbs",     # Hardness removed since recharge (lbs)
-    "daily_avg_rock_removed_lbs",      # Daily average hardness removed (lbs)
-    "total_rock_removed_lbs",          # Total hardness removed (lbs)
-
-    # Regeneration Status
-    "regen_status_enum",               # Current regeneration status
-    "days_since_last_regen",           # Days since last regeneration
-    "total_regens",                    # Total regeneration count
-    "manual_regens",                   # Manual regeneration count
-    "regen_time_rem_secs",             # Remaining regeneration time
-
-    # Critical Alerts
-    "low_salt_alert",                  # Low salt warning
-    "error_code_alert",                # System error alert
-    "flow_monitor_alert",              # Flow monitoring alert
-    "excessive_water_use_alert",       # High water usage alert
-    "floor_leak_detector_alert",       # Leak detection alert
-    "service_reminder_alert",          # Service reminder alert
-
-    # Signal and Connection
-    "rf_signal_strength_dbm",          # WiFi signal strength
-    "rf_signal_bars",                  # WiFi signal quality
-
-    # System Stats
-    "days_in_operation",               # Total days system has been running
-    "power_outage_count",              # Number of power outages
-    "service_reminder_months",         # Months until service needed
-    "time_lost_events",                # Time lost events count
-
-    # Additional sensors enabled for debugging/inspection
-    "iron_level_tenths_ppm",           # Iron level in water
-    "tlc_avg_temp_tenths_c",           # TLC average temperature
-    "salt_effic_grains_per_lb",        # Salt efficiency
-    "salt_type_enum",                  # Salt type
-    "water_counter_gals",              # Water counter
-    "error_code",                      # Error code number
-    "service_active",                  # Service mode active
-    "product_serial_number",           # Device serial number
-    "location",                        # Device location
-    "system_type",                     # System type
-    "model_display_code",              # Model display code
-    "base_software_version",           # Base software version
-    "esp_software_part_number",        # ESP software part number
-    "regen_time_secs",                 # Regeneration time setting
-    "system_error",                    # System error status
-    "vacation_mode",                   # Vacation mode status
-}
+SENSOR_CATEGORIES = MappingProxyType({
+    SensorCategory.BASIC: "Basic system information",
+    SensorCategory.WATER: "Water usage and flow metrics",
+    SensorCategory.SALT: "Salt level and usage metrics",
+    SensorCategory.REGEN: "Regeneration information",
+    SensorCategory.PERFORMANCE: "System performance metrics",
+    SensorCategory.MAINTENANCE: "Maintenance and service information",
+    SensorCategory.ALERTS: "System alerts and warnings",
+    SensorCategory.SYSTEM: "System status and configuration",
+})
+
+
+class SensorDesc(NamedTuple):
+    """Static metadata describing how a HydroLink property is exposed."""
+
+    name: str
+    unit: Optional[str]
+    device_class: Optional[SensorDeviceClass]
+    state_class: Optional[SensorStateClass]
+    icon: str
+    category: SensorCategory
+
+
+# Numeric device classes that must report None instead of "unknown"
+NUMERIC_DEVICE_CLASSES = frozenset({
+    SensorDeviceClass.ENERGY,
+    SensorDeviceClass.POWER,
+    SensorDeviceClass.CURRENT,
+    SensorDeviceClass.VOLTAGE,
+    SensorDeviceClass.PRESSURE,
+    SensorDeviceClass.TEMPERATURE,
+})
+
+# Salt values the API reports in thousandths of a pound
+THOUSANDTHS_SENSORS = frozenset({
+    "avg_salt_per_regen_lbs",
+    "total_salt_use_lbs",
+})
+
+
+def _value_divisor(property_name: str) -> int:
+    """Return the divisor that converts a raw API value to native units.
+
+    The API sends values like salt_level_tenths as 750 meaning 75.0%. This
+    applies to any property with "_tenths" in the name (even if not at the
+    end, e.g. iron_level_tenths_ppm) and to capacity_remaining_percent.
+    Salt masses are sent in thousandths and need dividing by 1000.
+    """
+    if "_tenths" in property_name or property_name == "capacity_remaining_percent":
+        return 10
+    if property_name in THOUSANDTHS_SENSORS:
+        return 1000
+    return 1
+
 
 # Descriptions for each sensor
-SENSOR_DESCRIPTIONS = {
+SENSOR_DESCRIPTIONS = MappingProxyType({
     # BASIC SYSTEM INFORMATION
-    "_internal_is_online": {
-        "name": "Online Status",
-        "unit": None,
-        "device_class": None,
-        "state_class": None,
-        "icon": "mdi:wifi-check",
-        "category": "BASIC",
-    },
-    # BASIC SYSTEM INFO
-    "app_active": {
-        "name": "App Active",
-        "unit": None,
-        "device_class": None,
-        "state_class": None,
-        "icon": "mdi:checkbox-marked-circle",
-        "category": "BASIC",
-    },
-    "current_time_secs": {
-        "name": "Device Time",
-        "unit": None,
-        "device_class": SensorDeviceClass.TIMESTAMP,
-        "state_class": None,
-        "icon": "mdi:clock-outline",
-        "category": "BASIC",
-    },
-    "model_description": {
-        "name": "Model",
-        "unit": None,
-        "device_class": None,
-        "state_class": None,
-        "icon": "mdi:water-well",
-        "category": "BASIC",
-    },
-    "nickname": {
-        "name": "Device Name",
-        "unit": None,
-        "device_class": None,
-        "state_class": None,
-        "icon": "mdi:label-outline",
-        "category": "BASIC",
-    },
+    "current_time_secs": SensorDesc(
+        name="Device Time",
+        unit=None,
+        device_class=SensorDeviceClass.TIMESTAMP,
+        state_class=None,
+        icon="mdi:clock-outline",
+        category=SensorCategory.BASIC,
+    ),
+    "model_description": SensorDesc(
+        name="Model",
+        unit=None,
+        device_class=None,
+        state_class=None,
+        icon="mdi:water-well",
+        category=SensorCategory.BASIC,
+    ),
+    "nickname": SensorDesc(
+        name="Device Name",
+        unit=None,
+        device_class=None,
+        state_class=None,
+        icon="mdi:label-outline",
+        category=SensorCategory.BASIC,
+    ),
 
     # WATER METRICS
-    "current_water_flow_gpm": {
-        "name": "Current Water Flow",
-        "unit": "gpm",
-        "device_class": None,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:water-outline",
-        "category": "WATER",
-    },
-    "gallons_used_today": {
-        "name": "Water Used Today",
-        "unit": UnitOfVolume.GALLONS,
-        "device_class": SensorDeviceClass.WATER,
-        "state_class": SensorStateClass.TOTAL_INCREASING,
-        "icon": "mdi:water",
-        "category": "WATER",
-    },
-    "avg_daily_use_gals": {
-        "name": "Average Daily Water Usage",
-        "unit": UnitOfVolume.GALLONS,
-        "device_class": SensorDeviceClass.WATER,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:chart-timeline-variant",
-        "category": "WATER",
-    },
-    "total_outlet_water_gals": {
-        "name": "Total Treated Water",
-        "unit": UnitOfVolume.GALLONS,
-        "device_class": SensorDeviceClass.WATER,
-        "state_class": SensorStateClass.TOTAL_INCREASING,
-        "icon": "mdi:meter-water",
-        "category": "WATER",
-    },
-    "peak_water_flow_gpm": {
-        "name": "Peak Water Flow",
-        "unit": "gpm",
-        "device_class": None,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:chart-bell-curve",
-        "category": "WATER",
-    },
-    "treated_water_avail_gals": {
-        "name": "Available Treated Water",
-        "unit": UnitOfVolume.GALLONS,
-        "device_class": SensorDeviceClass.WATER,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:water-check",
-        "category": "WATER",
-    },
+    "current_water_flow_gpm": SensorDesc(
+        name="Current Water Flow",
+        unit="gpm",
+        device_class=None,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:water-outline",
+        category=SensorCategory.WATER,
+    ),
+    "gallons_used_today": SensorDesc(
+        name="Water Used Today",
+        unit=UnitOfVolume.GALLONS,
+        device_class=SensorDeviceClass.WATER,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        icon="mdi:water",
+        category=SensorCategory.WATER,
+    ),
+    "avg_daily_use_gals": SensorDesc(
+        name="Average Daily Water Usage",
+        unit=UnitOfVolume.GALLONS,
+        device_class=SensorDeviceClass.WATER,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:chart-timeline-variant",
+        category=SensorCategory.WATER,
+    ),
+    "total_outlet_water_gals": SensorDesc(
+        name="Total Treated Water",
+        unit=UnitOfVolume.GALLONS,
+        device_class=SensorDeviceClass.WATER,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        icon="mdi:meter-water",
+        category=SensorCategory.WATER,
+    ),
+    "peak_water_flow_gpm": SensorDesc(
+        name="Peak Water Flow",
+        unit="gpm",
+        device_class=None,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:chart-bell-curve",
+        category=SensorCategory.WATER,
+    ),
+    "treated_water_avail_gals": SensorDesc(
+        name="Available Treated Water",
+        unit=UnitOfVolume.GALLONS,
+        device_class=SensorDeviceClass.WATER,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:water-check",
+        category=SensorCategory.WATER,
+    ),
 
     # SALT METRICS
     # Note: salt_level_tenths is automatically divided by 10 (API sends 750 for 75%)
-    "salt_level_tenths": {
-        "name": "Salt Level",
-        "unit": PERCENTAGE,
-        "device_class": None,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:salt",
-        "category": "SALT",
-    },
-    "out_of_salt_estimate_days": {
-        "name": "Days Until Salt Needed",
-        "unit": UnitOfTime.DAYS,
-        "device_class": None,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:calendar-clock",
-        "category": "SALT",
-    },
-    "avg_salt_per_regen_lbs": {
-        "name": "Salt Used per Regeneration",
-        "unit": UnitOfMass.POUNDS,
-        "device_class": None,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:scale-bathroom",
-        "category": "SALT",
-    },
-    "total_salt_use_lbs": {
-        "name": "Total Salt Used",
-        "unit": UnitOfMass.POUNDS,
-        "device_class": None,
-        "state_class": SensorStateClass.TOTAL_INCREASING,
-        "icon": "mdi:scale",
-        "category": "SALT",
-    },
+    "salt_level_tenths": SensorDesc(
+        name="Salt Level",
+        unit=PERCENTAGE,
+        device_class=None,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:salt",
+        category=SensorCategory.SALT,
+    ),
+    "out_of_salt_estimate_days": SensorDesc(
+        name="Days Until Salt Needed",
+        unit=UnitOfTime.DAYS,
+        device_class=None,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:calendar-clock",
+        category=SensorCategory.SALT,
+    ),
+    "avg_salt_per_regen_lbs": SensorDesc(
+        name="Salt Used per Regeneration",
+        unit=UnitOfMass.POUNDS,
+        device_class=None,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:scale-bathroom",
+        category=SensorCategory.SALT,
+    ),
+    "total_salt_use_lbs": SensorDesc(
+        name="Total Salt Used",
+        unit=UnitOfMass.POUNDS,
+        device_class=None,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        icon="mdi:scale",
+        category=SensorCategory.SALT,
+    ),
 
     # PERFORMANCE METRICS
-    "capacity_remaining_percent": {
-        "name": "Capacity Remaining",
-        "unit": PERCENTAGE,
-        "device_class": None,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:water-percent",
-        "category": "PERFORMANCE",
-    },
-    "operating_capacity_grains": {
-        "name": "Operating Capacity",
-        "unit": "grains",
-        "device_class": None,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:water",
-        "category": "PERFORMANCE",
-    },
-    "hardness_grains": {
-        "name": "Water Hardness",
-        "unit": "grains",
-        "device_class": None,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:water-outline",
-        "category": "PERFORMANCE",
-    },
-    "rock_removed_since_rech_lbs": {
-        "name": "Hardness Removed Since Recharge",
-        "unit": UnitOfMass.POUNDS,
-        "device_class": None,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:scale",
-        "category": "PERFORMANCE",
-    },
-    "daily_avg_rock_removed_lbs": {
-        "name": "Average Daily Hardness Removed",
-        "unit": UnitOfMass.POUNDS,
-        "device_class": None,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:scale-bathroom",
-        "category": "PERFORMANCE",
-    },
-    "total_rock_removed_lbs": {
-        "name": "Total Hardness Removed",
-        "unit": UnitOfMass.POUNDS,
-        "device_class": None,
-        "state_class": SensorStateClass.TOTAL_INCREASING,
-        "icon": "mdi:scale",
-        "category": "PERFORMANCE",
-    },
+    "capacity_remaining_percent": SensorDesc(
+        name="Capacity Remaining",
+        unit=PERCENTAGE,
+        device_class=None,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:water-percent",
+        category=SensorCategory.PERFORMANCE,
+    ),
+    "operating_capacity_grains": SensorDesc(
+        name="Operating Capacity",
+        unit="grains",
+        device_class=None,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:water",
+        category=SensorCategory.PERFORMANCE,
+    ),
+    "hardness_grains": SensorDesc(
+        name="Water Hardness",
+        unit="grains",
+        device_class=None,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:water-outline",
+        category=SensorCategory.PERFORMANCE,
+    ),
+    "rock_removed_since_rech_lbs": SensorDesc(
+        name="Hardness Removed Since Recharge",
+        unit=UnitOfMass.POUNDS,
+        device_class=None,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:scale",
+        category=SensorCategory.PERFORMANCE,
+    ),
+    "daily_avg_rock_removed_lbs": SensorDesc(
+        name="Average Daily Hardness Removed",
+        unit=UnitOfMass.POUNDS,
+        device_class=None,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:scale-bathroom",
+        category=SensorCategory.PERFORMANCE,
+    ),
+    "total_rock_removed_lbs": SensorDesc(
+        name="Total Hardness Removed",
+        unit=UnitOfMass.POUNDS,
+        device_class=None,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        icon="mdi:scale",
+        category=SensorCategory.PERFORMANCE,
+    ),
 
     # REGENERATION STATUS
-    "regen_status_enum": {
-        "name": "Regeneration Status",
-        "unit": None,
-        "device_class": None,
-        "state_class": None,
-        "icon": "mdi:sync",
-        "category": "REGEN",
-    },
-    "days_since_last_regen": {
-        "name": "Days Since Last Regeneration",
-        "unit": UnitOfTime.DAYS,
-        "device_class": None,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:calendar-clock",
-        "category": "REGEN",
-    },
-    "total_regens": {
-        "name": "Total Regenerations",
-        "unit": None,
-        "device_class": None,
-        "state_class": SensorStateClass.TOTAL_INCREASING,
-        "icon": "mdi:refresh",
-        "category": "REGEN",
-    },
-    "manual_regens": {
-        "name": "Manual Regenerations",
-        "unit": None,
-        "device_class": None,
-        "state_class": SensorStateClass.TOTAL_INCREASING,
-        "icon": "mdi:refresh",
-        "category": "REGEN",
-    },
-    "regen_time_rem_secs": {
-        "name": "Regeneration Time Remaining",
-        "unit": UnitOfTime.SECONDS,
-        "device_class": None,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:timer",
-        "category": "REGEN",
-    },
-
-    # ALERTS
-    "low_salt_alert": {
-        "name": "Low Salt Alert",
-        "unit": None,
-        "device_class": None,
-        "state_class": None,
-        "icon": "mdi:alert-circle",
-        "category": "ALERTS",
-    },
-    "error_code_alert": {
-        "name": "Error Code Alert",
-        "unit": None,
-        "device_class": None,
-        "state_class": None,
-        "icon": "mdi:alert",
-        "category": "ALERTS",
-    },
-    "flow_monitor_alert": {
-        "name": "Flow Monitor Alert",
-        "unit": None,
-        "device_class": None,
-        "state_class": None,
-        "icon": "mdi:water-alert",
-        "category": "ALERTS",
-    },
-    "excessive_water_use_alert": {
-        "name": "Excessive Water Use Alert",
-        "unit": None,
-        "device_class": None,
-        "state_class": None,
-        "icon": "mdi:water-alert",
-        "category": "ALERTS",
-    },
-    "floor_leak_detector_alert": {
-        "name": "Leak Detector Alert",
-        "unit": None,
-        "device_class": None,
-        "state_class": None,
-        "icon": "mdi:water-alert",
-        "category": "ALERTS",
-    },
-    "service_reminder_alert": {
-        "name": "Service Reminder Alert",
-        "unit": None,
-        "device_class": None,
-        "state_class": None,
-        "icon": "mdi:tools",
-        "category": "ALERTS",
-    },
+    "regen_status_enum": SensorDesc(
+        name="Regeneration Status",
+        unit=None,
+        device_class=None,
+        state_class=None,
+        icon="mdi:sync",
+        category=SensorCategory.REGEN,
+    ),
+    "days_since_last_regen": SensorDesc(
+        name="Days Since Last Regeneration",
+        unit=UnitOfTime.DAYS,
+        device_class=None,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:calendar-clock",
+        category=SensorCategory.REGEN,
+    ),
+    "total_regens": SensorDesc(
+        name="Total Regenerations",
+        unit=None,
+        device_class=None,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        icon="mdi:refresh",
+        category=SensorCategory.REGEN,
+    ),
+    "manual_regens": SensorDesc(
+        name="Manual Regenerations",
+        unit=None,
+        device_class=None,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        icon="mdi:refresh",
+        category=SensorCategory.REGEN,
+    ),
+    "regen_time_rem_secs": SensorDesc(
+        name="Regeneration Time Remaining",
+        unit=UnitOfTime.SECONDS,
+        device_class=None,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:timer",
+        category=SensorCategory.REGEN,
+    ),
 
     # SYSTEM STATUS
-    "rf_signal_strength_dbm": {
-        "name": "WiFi Signal Strength",
-        "unit": SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
-        "device_class": SensorDeviceClass.SIGNAL_STRENGTH,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:wifi",
-        "category": "SYSTEM",
-    },
-    "rf_signal_bars": {
-        "name": "WiFi Signal Quality",
-        "unit": None,
-        "device_class": None,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:wifi",
-        "category": "SYSTEM",
-    },
-    "days_in_operation": {
-        "name": "Days in Operation",
-        "unit": UnitOfTime.DAYS,
-        "device_class": None,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:calendar",
-        "category": "SYSTEM",
-    },
-    "power_outage_count": {
-        "name": "Power Outage Count",
-        "unit": None,
-        "device_class": None,
-        "state_class": SensorStateClass.TOTAL_INCREASING,
-        "icon": "mdi:power-plug-off",
-        "category": "SYSTEM",
-    },
-    "service_reminder_months": {
-        "name": "Months Until Service",
-        "unit": UnitOfTime.MONTHS,
-        "device_class": None,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:tools",
-        "category": "SYSTEM",
-    },
+    "rf_signal_strength_dbm": SensorDesc(
+        name="WiFi Signal Strength",
+        unit=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+        device_class=SensorDeviceClass.SIGNAL_STRENGTH,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:wifi",
+        category=SensorCategory.SYSTEM,
+    ),
+    "rf_signal_bars": SensorDesc(
+        name="WiFi Signal Quality",
+        unit=None,
+        device_class=None,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:wifi",
+        category=SensorCategory.SYSTEM,
+    ),
+    "days_in_operation": SensorDesc(
+        name="Days in Operation",
+        unit=UnitOfTime.DAYS,
+        device_class=None,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:calendar",
+        category=SensorCategory.SYSTEM,
+    ),
+    "power_outage_count": SensorDesc(
+        name="Power Outage Count",
+        unit=None,
+        device_class=None,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        icon="mdi:power-plug-off",
+        category=SensorCategory.SYSTEM,
+    ),
+    "service_reminder_months": SensorDesc(
+        name="Months Until Service",
+        unit=UnitOfTime.MONTHS,
+        device_class=None,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:tools",
+        category=SensorCategory.SYSTEM,
+    ),
 
     # ADDITIONAL SENSORS (not enabled by default)
-    "iron_level_tenths_ppm": {
-        "name": "Iron Level",
-        "unit": "ppm",
-        "device_class": None,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:test-tube",
-        "category": "PERFORMANCE",
-    },
-    "tlc_avg_temp_tenths_c": {
-        "name": "TLC Average Temperature",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:thermometer",
-        "category": "SYSTEM",
-    },
-    "salt_effic_grains_per_lb": {
-        "name": "Salt Efficiency",
-        "unit": "grains/lb",
-        "device_class": None,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:percent",
-        "category": "SALT",
-    },
-    "salt_type_enum": {
-        "name": "Salt Type",
-        "unit": None,
-        "device_class": None,
-        "state_class": None,
-        "icon": "mdi:salt",
-        "category": "SALT",
-    },
-    "water_counter_gals": {
-        "name": "Water Counter",
-        "unit": UnitOfVolume.GALLONS,
-        "device_class": SensorDeviceClass.WATER,
-        "state_class": SensorStateClass.TOTAL_INCREASING,
-        "icon": "mdi:counter",
-        "category": "WATER",
-    },
-    "error_code": {
-        "name": "Error Code",
-        "unit": None,
-        "device_class": None,
-        "state_class": None,
-        "icon": "mdi:alert-octagon",
-        "category": "ALERTS",
-    },
-    "service_active": {
-        "name": "Service Mode Active",
-        "unit": None,
-        "device_class": None,
-        "state_class": None,
-        "icon": "mdi:wrench",
-        "category": "MAINTENANCE",
-    },
-    "time_lost_events": {
-        "name": "Time Lost Events",
-        "unit": None,
-        "device_class": None,
-        "state_class": SensorStateClass.TOTAL_INCREASING,
-        "icon": "mdi:clock-alert",
-        "category": "SYSTEM",
-    },
-    "product_serial_number": {
-        "name": "Serial Number",
-        "unit": None,
-        "device_class": None,
-        "state_class": None,
-        "icon": "mdi:barcode",
-        "category": "BASIC",
-    },
-    "location": {
-        "name": "Location",
-        "unit": None,
-        "device_class": None,
-        "state_class": None,
-        "icon": "mdi:map-marker",
-        "category": "BASIC",
-    },
-    "system_type": {
-        "name": "System Type",
-        "unit": None,
-        "device_class": None,
-        "state_class": None,
-        "icon": "mdi:water-pump",
-        "category": "BASIC",
-    },
-    "model_display_code": {
-        "name": "Model Display Code",
-        "unit": None,
-        "device_class": None,
-        "state_class": None,
-        "icon": "mdi:identifier",
-        "category": "BASIC",
-    },
-    "base_software_version": {
-        "name": "Base Software Version",
-        "unit": None,
-        "device_class": None,
-        "state_class": None,
-        "icon": "mdi:application",
-        "category": "SYSTEM",
-    },
-    "esp_software_part_number": {
-        "name": "ESP Software Part Number",
-        "unit": None,
-        "device_class": None,
-        "state_class": None,
-        "icon": "mdi:chip",
-        "category": "SYSTEM",
-    },
-    "regen_time_secs": {
-        "name": "Regeneration Time",
-        "unit": UnitOfTime.SECONDS,
-        "device_class": None,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:timer-sand",
-        "category": "REGEN",
-    },
-    "system_error": {
-        "name": "System Error",
-        "unit": None,
-        "device_class": None,
-        "state_class": None,
-        "icon": "mdi:alert",
-        "category": "ALERTS",
-    },
-    "vacation_mode": {
-        "name": "Vacation Mode",
-        "unit": None,
-        "device_class": None,
-        "state_class": None,
-        "icon": "mdi:airplane",
-        "category": "BASIC",
-    },
-}
+    "iron_level_tenths_ppm": SensorDesc(
+        name="Iron Level",
+        unit="ppm",
+        device_class=None,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:test-tube",
+        category=SensorCategory.PERFORMANCE,
+    ),
+    "tlc_avg_temp_tenths_c": SensorDesc(
+        name="TLC Average Temperature",
+        unit=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:thermometer",
+        category=SensorCategory.SYSTEM,
+    ),
+    "salt_effic_grains_per_lb": SensorDesc(
+        name="Salt Efficiency",
+        unit="grains/lb",
+        device_class=None,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:percent",
+        category=SensorCategory.SALT,
+    ),
+    "salt_type_enum": SensorDesc(
+        name="Salt Type",
+        unit=None,
+        device_class=None,
+        state_class=None,
+        icon="mdi:salt",
+        category=SensorCategory.SALT,
+    ),
+    "water_counter_gals": SensorDesc(
+        name="Water Counter",
+        unit=UnitOfVolume.GALLONS,
+        device_class=SensorDeviceClass.WATER,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        icon="mdi:counter",
+        category=SensorCategory.WATER,
+    ),
+    "error_code": SensorDesc(
+        name="Error Code",
+        unit=None,
+        device_class=None,
+        state_class=None,
+        icon="mdi:alert-octagon",
+        category=SensorCategory.ALERTS,
+    ),
+    "service_active": SensorDesc(
+        name="Service Mode Active",
+        unit=None,
+        device_class=None,
+        state_class=None,
+        icon="mdi:wrench",
+        category=SensorCategory.MAINTENANCE,
+    ),
+    "time_lost_events": SensorDesc(
+        name="Time Lost Events",
+        unit=None,
+        device_class=None,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        icon="mdi:clock-alert",
+        category=SensorCategory.SYSTEM,
+    ),
+    "product_serial_number": SensorDesc(
+        name="Serial Number",
+        unit=None,
+        device_class=None,
+        state_class=None,
+        icon="mdi:barcode",
+        category=SensorCategory.BASIC,
+    ),
+    "location": SensorDesc(
+        name="Location",
+        unit=None,
+        device_class=None,
+        state_class=None,
+        icon="mdi:map-marker",
+        category=SensorCategory.BASIC,
+    ),
+    "system_type": SensorDesc(
+        name="System Type",
+        unit=None,
+        device_class=None,
+        state_class=None,
+        icon="mdi:water-pump",
+        category=SensorCategory.BASIC,
+    ),
+    "model_display_code": SensorDesc(
+        name="Model Display Code",
+        unit=None,
+        device_class=None,
+        state_class=None,
+        icon="mdi:identifier",
+        category=SensorCategory.BASIC,
+    ),
+    "base_software_version": SensorDesc(
+        name="Base Software Version",
+        unit=None,
+        device_class=None,
+        state_class=None,
+        icon="mdi:application",
+        category=SensorCategory.SYSTEM,
+    ),
+    "esp_software_part_number": SensorDesc(
+        name="ESP Software Part Number",
+        unit=None,
+        device_class=None,
+        state_class=None,
+        icon="mdi:chip",
+        category=SensorCategory.SYSTEM,
+    ),
+    "regen_time_secs": SensorDesc(
+        name="Regeneration Time",
+        unit=UnitOfTime.SECONDS,
+        device_class=None,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:timer-sand",
+        category=SensorCategory.REGEN,
+    ),
+    "system_error": SensorDesc(
+        name="System Error",
+        unit=None,
+        device_class=None,
+        state_class=None,
+        icon="mdi:alert",
+        category=SensorCategory.ALERTS,
+    ),
+})
+
+
+class _SensorPlan(NamedTuple):
+    """Everything HydroLinkSensor needs for one property, resolved up front."""
+
+    divisor: int
+    numeric_device_class: bool
+    passthrough: bool
+    unit: Optional[str]
+    device_class: Optional[SensorDeviceClass]
+    state_class: Optional[SensorStateClass]
+    icon: Optional[str]
+    enabled_default: bool
+    name: str
+
+
+def _plan(property_name: str) -> _SensorPlan:
+    """Resolve conversion and entity attributes for a property.
+
+    Properties without a description still get a plan so every API property
+    is exposed, just without unit, device class or icon.
+    """
+    divisor = _value_divisor(property_name)
+    description = SENSOR_DESCRIPTIONS.get(property_name)
+    if description is None:
+        name = property_name.replace("_", " ").title()
+        unit = device_class = state_class = icon = None
+    else:
+        name, unit, device_class, state_class, icon, _category = description
+    numeric_device_class = device_class in NUMERIC_DEVICE_CLASSES
+    return _SensorPlan(
+        divisor,
+        numeric_device_class,
+        divisor == 1 and not numeric_device_class,
+        unit,
+        device_class,
+        state_class,
+        icon,
+        property_name in DEFAULT_ENABLED_SENSORS,
+        name,
+    )
+
+
+# Plans for every described property, resolved at import
+_SENSOR_PLANS = MappingProxyType({name: _plan(name) for name in SENSOR_DESCRIPTIONS})
+
+
+@lru_cache(maxsize=256)
+def _undescribed_plan(property_name: str) -> _SensorPlan:
+    """Return the plan for a property without a description, resolved once."""
+    return _plan(property_name)
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
     """Set up the HydroLink sensors from a config entry."""
-    import logging
-    _LOGGER = logging.getLogger(__name__)
-    
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    entities = []
-    
-    for device in coordinator.data:
-        # Assuming 'demand_softener' is the target device type
-        if device.get("system_type") != "demand_softener":
-            continue
-
-        device_name = device.get("nickname", "EcoWater Softener")
-        
-        # Log all available properties from API for debugging
-        available_props = list(device.get("properties", {}).keys())
-        _LOGGER.info(
-            "HydroLink device '%s' has %d properties available from API: %s",
-            device_name,
-            len(available_props),
-            ", ".join(sorted(available_props))
-        )
 
-        for prop_name, prop_info in device.get("properties", {}).items():
-            if isinstance(prop_info, dict) and "value" in prop_info:
-                entities.append(HydroLinkSensor(coordinator, device["id"], prop_name, device_name))
+    # Assuming 'demand_softener' is the target device type
+    softeners = softener_devices(coordinator.data)
+
+    # Log all available properties from API for debugging; skip the
+    # sort/join entirely unless INFO logging is actually enabled
+    if _LOGGER.isEnabledFor(logging.INFO):
+        for device in softeners:
+            props = device["properties"]
+            _LOGGER.info(
+                "HydroLink device '%s' has %d properties available from API: %s",
+                device.get("nickname", "EcoWater Softener"),
+                len(props),
+                ", ".join(sorted(props))
+            )
+
+    # API payloads are plain JSON dicts, so an exact type check suffices.
+    # On/off properties are exposed by the binary_sensor platform instead.
+    entities = [
+        HydroLinkSensor(
+            coordinator,
+            device["id"],
+            prop_name,
+            device.get("nickname", "EcoWater Softener"),
+        )
+        for device in softeners
+        for prop_name, prop_info in device["properties"].items()
+        if type(prop_info) is dict
+        and "value" in prop_info
+        and prop_name not in BINARY_SENSOR_PROPERTIES
+    ]
 
     _LOGGER.info("Created %d HydroLink sensor entities", len(entities))
     async_add_entities(entities)
 
 
-class HydroLinkSensor(CoordinatorEntity, SensorEntity):
+class HydroLinkSensor(HydroLinkEntity, SensorEntity):
     """Representation of a HydroLink sensor."""
 
     def __init__(self, coordinator, device_id, property_name, device_name):
         """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._device_id = device_id
-        self._property_name = property_name
-        self._device_name = device_name
-
-        description = SENSOR_DESCRIPTIONS.get(property_name)
-        if description:
-            self._attr_name = f"{device_name} {description['name']}"
-            self._attr_native_unit_of_measurement = description.get("unit")
-            self._attr_device_class = description.get("device_class")
-            self._attr_state_class = description.get("state_class")
-            self._attr_icon = description.get("icon")
-            self._attr_entity_category = description.get("entity_category")
-        else:
-            self._attr_name = f"{device_name} {property_name.replace('_', ' ').title()}"
-
-        self._attr_unique_id = f"hydrolink_{device_id}_{property_name}"
-
-        # Set whether the entity should be enabled by default
-        self._attr_entity_registry_enabled_default = (
-            self._property_name in DEFAULT_ENABLED_SENSORS
-        )
-
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        for device in self.coordinator.data:
-            if device["id"] == self._device_id:
-                value = device["properties"][self._property_name].get("value")
-
-                # Handle numeric sensors when value is unknown
-                if (value == "unknown" and self.device_class in [
-                    SensorDeviceClass.ENERGY,
-                    SensorDeviceClass.POWER,
-                    SensorDeviceClass.CURRENT,
-                    SensorDeviceClass.VOLTAGE,
-                    SensorDeviceClass.PRESSURE,
-                    SensorDeviceClass.TEMPERATURE
-                ]):
-                    return None
-
-                # Convert values that are provided in tenths
-                # API sends values like salt_level_tenths as 750 meaning 75.0%
-                # Also applies to iron_level_tenths_ppm, capacity_remaining_percent, etc.
-                if isinstance(value, (int, float)):
-                    # Handle properties with "_tenths" in the name (even if not at the end)
-                    if "_tenths" in self._property_name:
-                        return value / 10
-
-                    # capacity_remaining_percent is also in tenths
-                    if self._property_name == "capacity_remaining_percent":
-                        return value / 10
-
-                    # Salt values are provided in milligrams/thousandths, need to divide by 1000
-                    if self._property_name in ["avg_salt_per_regen_lbs", "total_salt_use_lbs"]:
-                        return value / 1000
-
-                return value
-        return None
-
-    @property
-    def device_info(self):
-        """Return device information."""
-        return {
-            "identifiers": {(DOMAIN, self._device_id)},
-            "name": self._device_name,
-            "manufacturer": "EcoWater",
-        }
+        super().__init__(coordinator, device_id, property_name, device_name)
+        (
+            self._divisor,
+            self._numeric_device_class,
+            self._passthrough,
+            self._attr_native_unit_of_measurement,
+            self._attr_device_class,
+            self._attr_state_class,
+            self._attr_icon,
+            self._attr_entity_registry_enabled_default,
+            name,
+        ) = _SENSOR_PLANS.get(property_name) or _undescribed_plan(property_name)
+        self._attr_name = _entity_name(device_name, name)
+        self._update_value()
+
+    def _apply_value(self, value):
+        """Store the converted value as the sensor's native value."""
+        self._attr_native_value = value = self._convert_value(value)
+        return value
+
+    def _convert_value(self, value):
+        """Convert a raw API value to this sensor's native value."""
+        # Text, enum and unscaled sensors need no post-processing
+        if self._passthrough:
+            return value
+
+        # Handle numeric sensors when value is unknown
+        if self._numeric_device_class and value == "unknown":
+            return None
+
+        # Scale values the API reports in tenths/thousandths
+        if self._divisor != 1 and isinstance(value, (int, float)):
+            return value / self._divisor
+
+        return value
@@ -46,9 +46,8 @@ License: MIT
 See LICENSE file in the project root for full license information.
 """
 
-from typing import Dict, Any
 import voluptuous as vol
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.const import ATTR_DEVICE_ID
 from homeassistant.helpers import device_registry as dr
 
@@ -57,24 +56,49 @@ from .api import CannotConnect, InvalidAuth
 
 async def async_setup_services(hass: HomeAssistant) -> None:
     """Set up HydroLink services."""
+    # Called for every config entry; only the first one registers the service
+    if hass.services.has_service(DOMAIN, SERVICE_TRIGGER_REGENERATION):
+        return
+
     device_registry = dr.async_get(hass)
 
+    # Device ID -> config entry ID, dropped whenever the device registry changes
+    entry_ids = {}
+
+    @callback
+    def _async_clear_entry_ids(event) -> None:
+        """Forget cached config entries after a device registry update."""
+        entry_ids.clear()
+
+    hass.bus.async_listen(dr.EVENT_DEVICE_REGISTRY_UPDATED, _async_clear_entry_ids)
+
     async def trigger_regeneration(call: ServiceCall) -> None:
         """Handle the regeneration trigger service call."""
         device_id = call.data[ATTR_DEVICE_ID]
 
-        # Find the correct device entry
-        device_entries = dr.async_entries_for_device_id(device_registry, device_id)
-        if not device_entries:
-            raise ValueError(f"Device {device_id} not found")
-            
-        # Get the first config entry ID for this device
-        entry_id = next(iter(device_entries)).config_entry_id
-        if not entry_id:
-            raise ValueError(f"No config entry found for device {device_id}")
+        # A cached entry may have been unloaded since it was looked up
+        loaded_entries = hass.data.get(DOMAIN, {})
+        entry_id = entry_ids.get(device_id)
+        if entry_id not in loaded_entries:
+            # Find the device and the loaded HydroLink config entry that owns it
+            device = device_registry.async_get(device_id)
+            if device is None:
+                raise ValueError(f"Device {device_id} not found")
+
+            entry_id = next(
+                (
+                    config_entry_id
+                    for config_entry_id in device.config_entries
+                    if config_entry_id in loaded_entries
+                ),
+                None,
+            )
+            if entry_id is None:
+                raise ValueError(f"No config entry found for device {device_id}")
+            entry_ids[device_id] = entry_id
 
         # Get the API instance from the coordinator
-        coordinator = hass.data[DOMAIN][entry_id]
+        coordinator = loaded_entries[entry_id]
         
         try:
             await hass.async_add_executor_job(
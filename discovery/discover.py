@@ -9,7 +9,12 @@ import json
 import logging
 import sys
 import os
-from datetime import datetime
+import time
+
+try:
+    import orjson
+except ImportError:  # optional speedup, fall back to the stdlib encoder
+    orjson = None
 
 sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), "custom_components/hydrolink"))
 from api import HydroLinkApi
@@ -18,21 +23,48 @@ OUTPUT_DIR = os.path.join(os.path.dirname(__file__), "outputs")
 logging.basicConfig(level=logging.INFO)
 _LOGGER = logging.getLogger(__name__)
 
+def output_paths(*names):
+    """Return timestamped output paths for names, creating the output directory once."""
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
+    return [os.path.join(OUTPUT_DIR, f"{name}_{timestamp}.json") for name in names]
+
+def _dumps(data, pretty):
+    """Serialize data to JSON bytes, indented when pretty is set."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(data, indent=2).encode()
+    return json.dumps(data, separators=(",", ":")).encode()
+
+def write_json(path, data, pretty=True):
+    """Write data to path as JSON, using orjson when available."""
+    with open(path, "wb") as f:
+        f.write(_dumps(data, pretty))
+
+def stream_json_array(path, items, pretty=True):
+    """Write items to path as a JSON array, serializing one item at a time."""
+    separator = b",\n" if pretty else b","
+    with open(path, "wb") as f:
+        f.write(b"[\n" if pretty else b"[")
+        for index, item in enumerate(items):
+            if index:
+                f.write(separator)
+            f.write(_dumps(item, pretty))
+        f.write(b"\n]\n" if pretty else b"]\n")
+
 def discover():
     parser = argparse.ArgumentParser()
     parser.add_argument("--email", required=True)
     parser.add_argument("--password", required=True)
+    parser.add_argument("--compact", action="store_true", help="Write compact instead of indented JSON")
     args = parser.parse_args()
 
     api = HydroLinkApi(args.email, args.password)
     data = api.get_data()
 
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    output_file = os.path.join(OUTPUT_DIR, f"discovery_{timestamp}.json")
-    
-    with open(output_file, "w") as f:
-        json.dump(data, f, indent=2)
+    output_file, = output_paths("discovery")
+    write_json(output_file, data, pretty=not args.compact)
     _LOGGER.info(f"Data written to {output_file}")
 
 if __name__ == "__main__":
@@ -1,22 +1,83 @@
 # -*- coding: utf-8 -*-
 """EcoWater HydroLink API Discovery Tool"""
 import argparse
-import json
 import logging
 import sys
 import os
-from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict
 
 # Add custom_components to path
 sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), "custom_components/hydrolink"))
 from api import HydroLinkApi
+from discover import output_paths, stream_json_array
 
 # Setup
-OUTPUT_DIR = os.path.join(os.path.dirname(__file__), "outputs")
 logging.basicConfig(level=logging.INFO)
 _LOGGER = logging.getLogger(__name__)
 
+# Property -> (section, group, field, divisor) in the cleaned output;
+# a divisor of None keeps the API value as-is
+_PROPERTY_FIELDS = {
+    # Daily metrics
+    "gallons_used_today": ("metrics", "daily", "usage", None),
+    "avg_daily_use_gals": ("metrics", "daily", "average_usage", None),
+    "daily_avg_rock_removed_lbs": ("metrics", "daily", "rock_removed", None),
+
+    # Current metrics
+    "current_water_flow_gpm": ("metrics", "current", "flow_rate", None),
+    "water_counter_gals": ("metrics", "current", "total_usage", None),
+    "treated_water_avail_gals": ("metrics", "current", "treated_water_remaining", None),
+    "capacity_remaining_percent": ("metrics", "current", "capacity_remaining", None),
+
+    # Lifetime metrics
+    "total_outlet_water_gals": ("metrics", "lifetime", "total_usage", None),
+    "total_regens": ("metrics", "lifetime", "total_regens", None),
+    "total_rock_removed_lbs": ("metrics", "lifetime", "rock_removed", None),
+    "days_in_operation": ("metrics", "lifetime", "days_in_operation", None),
+    "days_since_last_regen": ("metrics", "lifetime", "days_since_regen", None),
+    "time_lost_events": ("metrics", "lifetime", "time_lost_events", None),
+
+    # Salt management
+    "salt_level_tenths": ("maintenance", "salt", "level", 10),
+    "out_of_salt_estimate_days": ("maintenance", "salt", "days_remaining", None),
+    "low_salt_alert": ("maintenance", "salt", "low_alert", None),
+    "salt_effic_grains_per_lb": ("maintenance", "salt", "efficiency", None),
+    "total_salt_use_lbs": ("maintenance", "salt", "total_usage", None),
+    "avg_salt_per_regen_lbs": ("maintenance", "salt", "avg_per_regen", 1000),
+    "salt_type_enum": ("maintenance", "salt", "type", None),
+
+    # Service info
+    "service_active": ("maintenance", "service", "active", None),
+    "service_reminder_months": ("maintenance", "service", "reminder_months", None),
+    "service_reminder_alert": ("maintenance", "service", "reminder_alert", None),
+
+    # Error info
+    "error_code": ("maintenance", "errors", "code", None),
+    "error_code_alert": ("maintenance", "errors", "alert", None),
+    "floor_leak_detector_alert": ("maintenance", "errors", "leak_alert", None),
+    "flow_monitor_alert": ("maintenance", "errors", "flow_alert", None),
+}
+
+# Property -> field under "status"
+_STATUS_FIELDS = {
+    "_internal_is_online": "is_online",
+    "rf_signal_strength_dbm": "signal_strength",
+    "rf_signal_bars": "signal_bars",
+}
+
+# Important settings kept verbatim. Only ever iterated, so a tuple: it keeps
+# the report's settings in this order, where a frozenset's would change with
+# the string hash seed from run to run.
+_SETTING_KEYS = (
+    "hardness_grains",
+    "iron_level_tenths_ppm",
+    "operating_capacity_grains",
+    "regen_time_secs",
+    "model_display_code",
+    "base_software_version",
+    "esp_software_part_number",
+)
+
 def clean_data(device: Dict) -> Dict:
     """Clean and organize device data."""
     result = {
@@ -82,99 +143,34 @@ def clean_data(device: Dict) -> Dict:
         "settings": {}
     }
     
-    # Process properties
+    # Look up the mapped keys rather than scanning every property; some
+    # firmware reports well over a hundred properties, most of them unused
+    status = result["status"]
+    settings = result["settings"]
     props = device.get("properties", {})
-    for key, data in props.items():
+    for key, (section, group, field, divisor) in _PROPERTY_FIELDS.items():
+        data = props.get(key)
+        if data is None:
+            continue
         value = data.get("value")
-        updated = data.get("updated_at")
-        
-        # Online status
-        if key == "_internal_is_online":
-            result["status"]["is_online"] = value
-            result["status"]["last_updated"] = updated
-        elif key == "rf_signal_strength_dbm":
-            result["status"]["signal_strength"] = value
-        elif key == "rf_signal_bars":
-            result["status"]["signal_bars"] = value
-            
-        # Daily metrics
-        elif key == "gallons_used_today":
-            result["metrics"]["daily"]["usage"] = {"value": value, "updated": updated}
-        elif key == "avg_daily_use_gals":
-            result["metrics"]["daily"]["average_usage"] = {"value": value, "updated": updated}
-        elif key == "daily_avg_rock_removed_lbs":
-            result["metrics"]["daily"]["rock_removed"] = {"value": value, "updated": updated}
-            
-        # Current metrics
-        elif key == "current_water_flow_gpm":
-            result["metrics"]["current"]["flow_rate"] = {"value": value, "updated": updated}
-        elif key == "water_counter_gals":
-            result["metrics"]["current"]["total_usage"] = {"value": value, "updated": updated}
-        elif key == "treated_water_avail_gals":
-            result["metrics"]["current"]["treated_water_remaining"] = {"value": value, "updated": updated}
-        elif key == "capacity_remaining_percent":
-            result["metrics"]["current"]["capacity_remaining"] = {"value": value, "updated": updated}
-            
-        # Lifetime metrics
-        elif key == "total_outlet_water_gals":
-            result["metrics"]["lifetime"]["total_usage"] = {"value": value, "updated": updated}
-        elif key == "total_regens":
-            result["metrics"]["lifetime"]["total_regens"] = {"value": value, "updated": updated}
-        elif key == "total_rock_removed_lbs":
-            result["metrics"]["lifetime"]["rock_removed"] = {"value": value, "updated": updated}
-        elif key == "days_in_operation":
-            result["metrics"]["lifetime"]["days_in_operation"] = {"value": value, "updated": updated}
-        elif key == "days_since_last_regen":
-            result["metrics"]["lifetime"]["days_since_regen"] = {"value": value, "updated": updated}
-        elif key == "time_lost_events":
-            result["metrics"]["lifetime"]["time_lost_events"] = {"value": value, "updated": updated}
-            
-        # Salt management
-        elif key == "salt_level_tenths":
-            result["maintenance"]["salt"]["level"] = {"value": value / 10, "updated": updated}
-        elif key == "out_of_salt_estimate_days":
-            result["maintenance"]["salt"]["days_remaining"] = {"value": value, "updated": updated}
-        elif key == "low_salt_alert":
-            result["maintenance"]["salt"]["low_alert"] = {"value": value, "updated": updated}
-        elif key == "salt_effic_grains_per_lb":
-            result["maintenance"]["salt"]["efficiency"] = {"value": value, "updated": updated}
-        elif key == "total_salt_use_lbs":
-            result["maintenance"]["salt"]["total_usage"] = {"value": value, "updated": updated}
-        elif key == "avg_salt_per_regen_lbs":
-            result["maintenance"]["salt"]["avg_per_regen"] = {"value": value / 1000, "updated": updated}
-        elif key == "salt_type_enum":
-            result["maintenance"]["salt"]["type"] = {"value": value, "updated": updated}
-            
-        # Service info
-        elif key == "service_active":
-            result["maintenance"]["service"]["active"] = {"value": value, "updated": updated}
-        elif key == "service_reminder_months":
-            result["maintenance"]["service"]["reminder_months"] = {"value": value, "updated": updated}
-        elif key == "service_reminder_alert":
-            result["maintenance"]["service"]["reminder_alert"] = {"value": value, "updated": updated}
-            
-        # Error info
-        elif key == "error_code":
-            result["maintenance"]["errors"]["code"] = {"value": value, "updated": updated}
-        elif key == "error_code_alert":
-            result["maintenance"]["errors"]["alert"] = {"value": value, "updated": updated}
-        elif key == "floor_leak_detector_alert":
-            result["maintenance"]["errors"]["leak_alert"] = {"value": value, "updated": updated}
-        elif key == "flow_monitor_alert":
-            result["maintenance"]["errors"]["flow_alert"] = {"value": value, "updated": updated}
-            
-        # Keep important settings
-        elif key in [
-            "hardness_grains", 
-            "iron_level_tenths_ppm",
-            "operating_capacity_grains",
-            "regen_time_secs",
-            "model_display_code",
-            "base_software_version",
-            "esp_software_part_number"
-        ]:
-            result["settings"][key] = {"value": value, "updated": updated}
-    
+        # Offline devices report None or "unknown"; keep those as they are
+        if divisor and isinstance(value, (int, float)):
+            value = value / divisor
+        result[section][group][field] = {"value": value, "updated": data.get("updated_at")}
+
+    # Status fields hold the bare value
+    for key, field in _STATUS_FIELDS.items():
+        data = props.get(key)
+        if data is not None:
+            status[field] = data.get("value")
+            if key == "_internal_is_online":
+                status["last_updated"] = data.get("updated_at")
+
+    for key in _SETTING_KEYS:
+        data = props.get(key)
+        if data is not None:
+            settings[key] = {"value": data.get("value"), "updated": data.get("updated_at")}
+
     return result
 
 def main(args):
@@ -183,24 +179,21 @@ def main(args):
 
     # Get device data
     devices = api.get_data()
-    cleaned_devices = [clean_data(device) for device in devices]
 
-    # Create output directory if it doesn't exist
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    # Both files share one timestamp and output directory
+    raw_filepath, clean_filepath = output_paths("discovery_raw", "discovery_cleaned")
 
     # Save raw data for comparison
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    raw_filename = f"discovery_raw_{timestamp}.json"
-    raw_filepath = os.path.join(OUTPUT_DIR, raw_filename)
-    with open(raw_filepath, "w") as f:
-        json.dump(devices, f, indent=4)
+    stream_json_array(raw_filepath, devices, pretty=not args.compact)
     _LOGGER.info(f"Raw data saved to {raw_filepath}")
 
     # Save cleaned data
-    clean_filename = f"discovery_cleaned_{timestamp}.json"
-    clean_filepath = os.path.join(OUTPUT_DIR, clean_filename)
-    with open(clean_filepath, "w") as f:
-        json.dump(cleaned_devices, f, indent=4)
+    # Clean each device as it is written instead of holding a cleaned copy
+    stream_json_array(
+        clean_filepath,
+        (clean_data(device) for device in devices),
+        pretty=not args.compact,
+    )
     _LOGGER.info(f"Cleaned data saved to {clean_filepath}")
 
 if __name__ == "__main__":
@@ -208,6 +201,7 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="HydroLink Discovery Tool")
     parser.add_argument("--email", required=True, help="HydroLink account email")
     parser.add_argument("--password", required=True, help="HydroLink account password")
+    parser.add_argument("--compact", action="store_true", help="Write compact instead of indented JSON")
     args = parser.parse_args()
     
     main(args)
\ No newline at end of file
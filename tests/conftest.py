@@ -30,6 +30,14 @@ from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
 from homeassistant.core import HomeAssistant
 from pytest_socket import disable_socket, enable_socket
 
+from custom_components.hydrolink.const import DOMAIN
+from tests.helpers import create_mock_config_entry
+
+MOCK_CONFIG = {
+    CONF_EMAIL: "test@example.com",
+    CONF_PASSWORD: "password123",
+}
+
 @pytest.fixture(autouse=True)
 def disable_socket_for_tests():
     """Disable socket usage for most tests."""
@@ -48,14 +56,17 @@ class MockEventLoop(asyncio.AbstractEventLoop):
         self.set_debug = Mock()
         self.run_until_complete = Mock()
         self.close = Mock()
+        self._done_future = None
 
     def get_debug(self):
         return False
 
     def create_future(self):
-        fut = asyncio.Future()
-        fut.set_result(None)
-        return fut
+        # A resolved future never changes state again, so share a single one
+        if self._done_future is None:
+            self._done_future = asyncio.Future()
+            self._done_future.set_result(None)
+        return self._done_future
     
     def call_soon(self, callback, *args, context=None):
         callback(*args)
@@ -107,7 +118,9 @@ def hass(mock_event_loop):
     
     # Mock core services
     hass.services = Mock()
-    hass.services.async_register = AsyncMock()
+    hass.services.async_register = Mock()
+    hass.services.has_service = Mock(return_value=False)
+    hass.bus = Mock()
     
     # Mock async methods
     hass.async_add_executor_job = AsyncMock()
@@ -121,4 +134,9 @@ def hass(mock_event_loop):
     # Set up loop
     hass.loop = mock_event_loop
     
-    return hass
\ No newline at end of file
+    return hass
+
+@pytest.fixture
+def mock_config_entry():
+    """Create a mock config entry."""
+    return create_mock_config_entry(DOMAIN, MOCK_CONFIG, unique_id=MOCK_CONFIG[CONF_EMAIL])
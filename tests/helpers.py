@@ -28,10 +28,17 @@ Changelog:
 License: MIT
 See LICENSE file in the project root for full license information.
 """
+import inspect
 from unittest.mock import AsyncMock, Mock, patch
 
+from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
+# Newer Home Assistant versions require discovery_keys, older ones reject it
+_CONFIG_ENTRY_HAS_DISCOVERY_KEYS = (
+    "discovery_keys" in inspect.signature(ConfigEntry).parameters
+)
+
 def create_mock_hass():
     """Create a mock Home Assistant instance."""
     hass = Mock(spec=HomeAssistant)
@@ -58,6 +65,25 @@ def create_mock_hass():
     
     # Mock services
     hass.services = Mock()
-    hass.services.async_register = AsyncMock()
+    hass.services.async_register = Mock()
+    hass.services.has_service = Mock(return_value=False)
+    hass.bus = Mock()
     
-    return hass
\ No newline at end of file
+    return hass
+
+def create_mock_config_entry(domain, data, unique_id=None):
+    """Create a config entry compatible with the installed Home Assistant."""
+    kwargs = {}
+    if _CONFIG_ENTRY_HAS_DISCOVERY_KEYS:
+        kwargs["discovery_keys"] = None
+    return ConfigEntry(
+        version=1,
+        minor_version=1,
+        domain=domain,
+        title="HydroLink Test",
+        data=data,
+        source="user",
+        options={},
+        unique_id=unique_id,
+        **kwargs,
+    )
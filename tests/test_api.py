@@ -1,7 +1,6 @@
 """Unit tests for the HydroLink API interface."""
 import json
 import threading
-import time
 from unittest.mock import Mock, patch
 import pytest
 import requests
@@ -33,23 +32,29 @@ def mock_response():
 
 def test_login_success(api, mock_response):
     """Test successful login."""
-    with patch("requests.post", return_value=mock_response):
+    with patch.object(api._session, "post", return_value=mock_response):
         assert api.login() is True
         assert api.auth_cookie == MOCK_AUTH_COOKIE
 
-def test_login_invalid_auth(api):
-    """Test login with invalid credentials."""
+@pytest.mark.parametrize(
+    "status_code,side_effect,expected",
+    [
+        (401, None, InvalidAuth),
+        (429, None, CannotConnect),
+        (500, None, CannotConnect),
+        (None, requests.ConnectionError, CannotConnect),
+        (None, requests.Timeout, CannotConnect),
+    ],
+)
+def test_login_errors(api, status_code, side_effect, expected):
+    """Test login error responses and transport failures."""
     mock_response = Mock(spec=requests.Response)
-    mock_response.status_code = 401
-    
-    with patch("requests.post", return_value=mock_response):
-        with pytest.raises(InvalidAuth):
-            api.login()
+    mock_response.status_code = status_code
 
-def test_login_connection_error(api):
-    """Test login with connection error."""
-    with patch("requests.post", side_effect=requests.ConnectionError):
-        with pytest.raises(CannotConnect):
+    with patch.object(
+        api._session, "post", return_value=mock_response, side_effect=side_effect
+    ):
+        with pytest.raises(expected):
             api.login()
 
 def test_get_data_success(api, mock_response):
@@ -75,8 +80,8 @@ def test_get_data_success(api, mock_response):
     mock_ws_response.json = Mock(return_value={"websocket_uri": "/ws/test"})
     
     # Mock requests and socket operations
-    with patch("requests.get", side_effect=[mock_response, mock_ws_response, mock_response]), \
-         patch("requests.post", return_value=mock_response), \
+    with patch.object(api._session, "get", side_effect=[mock_response, mock_ws_response, mock_response]), \
+         patch.object(api._session, "post", return_value=mock_response), \
          patch("socket.socket"), \
          patch("websocket.WebSocketApp"):
         # Login first (we know requests.post is mocked)
@@ -92,17 +97,32 @@ def test_get_data_no_auth(api):
     mock_response = Mock(spec=requests.Response)
     mock_response.status_code = 401
     
-    with patch("requests.post", return_value=mock_response) as mock_post:
+    with patch.object(api._session, "post", return_value=mock_response) as mock_post:
         with pytest.raises(InvalidAuth):
             api.get_data()
 
 def test_get_data_connection_error(api):
     """Test data retrieval with connection error."""
     api.auth_cookie = MOCK_AUTH_COOKIE
-    with patch("requests.get", side_effect=requests.ConnectionError):
+    with patch.object(api._session, "get", side_effect=requests.ConnectionError):
         with pytest.raises(CannotConnect):
             api.get_data()
 
+def test_session_access_is_serialized(api, mock_response):
+    """Test requests from executor threads take the session lock."""
+    def locked_get(*args, **kwargs):
+        assert api._session_lock.locked()
+        return mock_response
+
+    with patch.object(api._session, "get", side_effect=locked_get):
+        api._get(f"{api.BASE_URL}/devices")
+
+def test_close(api):
+    """Test closing the API closes the shared session."""
+    with patch.object(api._session, "close") as mock_close:
+        api.close()
+    mock_close.assert_called_once_with()
+
 def test_websocket_message_handling(api):
     """Test WebSocket message handling."""
     api.ws_uri = "wss://test.com/ws"
@@ -130,8 +150,10 @@ def test_websocket_message_handling(api):
         ws_thread.daemon = True  # Make sure thread doesn't block test exit
         ws_thread.start()
         
-        # Give thread time to start
-        time.sleep(0.1)
+        # run_forever is mocked and returns at once, so wait for the
+        # thread to finish registering the callbacks
+        ws_thread.join(timeout=1)
+        assert not ws_thread.is_alive()
         
         # Call the callback directly
         test_message = {"test": "data"}
@@ -144,7 +166,4 @@ def test_websocket_message_handling(api):
         if message_callback:
             mock_ws.close()  # Actually call close() before asserting
             mock_ws.on_close(mock_ws) if mock_ws.on_close else None
-            assert mock_ws.close.called
-
-        # Wait for thread to finish
-        ws_thread.join(timeout=1)
\ No newline at end of file
+            assert mock_ws.close.called
\ No newline at end of file
@@ -0,0 +1,123 @@
+"""Unit tests for the HydroLink binary sensor platform."""
+from unittest.mock import Mock
+import pytest
+from homeassistant.components.binary_sensor import BinarySensorDeviceClass
+from homeassistant.core import HomeAssistant
+from custom_components.hydrolink.binary_sensor import (
+    BINARY_SENSOR_DESCRIPTIONS,
+    HydroLinkBinarySensor,
+    async_setup_entry,
+)
+from custom_components.hydrolink.const import (
+    BINARY_SENSOR_PROPERTIES,
+    DEFAULT_ENABLED_SENSORS,
+)
+from custom_components.hydrolink.coordinator import index_property_values
+from custom_components.hydrolink.sensor import (
+    async_setup_entry as async_setup_sensor_entry,
+)
+
+# Test data
+MOCK_DEVICE_ID = "test-device-id"
+MOCK_DEVICE_NAME = "Test Device"
+
+@pytest.fixture
+def mock_coordinator():
+    """Create a mock coordinator with a mix of on/off and regular properties."""
+    coordinator = Mock()
+    coordinator.data = [
+        {
+            "id": MOCK_DEVICE_ID,
+            "system_type": "demand_softener",
+            "nickname": MOCK_DEVICE_NAME,
+            "properties": {
+                "_internal_is_online": {"value": True},
+                "low_salt_alert": {"value": 1},
+                "floor_leak_detector_alert": {"value": 0},
+                "vacation_mode": {"value": "unknown"},
+                "salt_level_tenths": {"value": 750},
+            }
+        }
+    ]
+    coordinator.values = index_property_values(coordinator.data)
+    return coordinator
+
+def test_binary_sensor_attributes(mock_coordinator):
+    """Test binary sensor naming, device class and unique ID."""
+    sensor = HydroLinkBinarySensor(
+        mock_coordinator, MOCK_DEVICE_ID, "_internal_is_online", MOCK_DEVICE_NAME
+    )
+    assert sensor._attr_name == f"{MOCK_DEVICE_NAME} Online Status"
+    assert sensor._attr_device_class == BinarySensorDeviceClass.CONNECTIVITY
+    assert sensor._attr_unique_id == f"hydrolink_{MOCK_DEVICE_ID}__internal_is_online"
+    assert sensor.device_info["identifiers"] == {("hydrolink", MOCK_DEVICE_ID)}
+
+def test_binary_sensor_registry_defaults(mock_coordinator):
+    """Test names are shared and enabled defaults follow DEFAULT_ENABLED_SENSORS."""
+    first = HydroLinkBinarySensor(
+        mock_coordinator, MOCK_DEVICE_ID, "low_salt_alert", MOCK_DEVICE_NAME
+    )
+    second = HydroLinkBinarySensor(
+        mock_coordinator, MOCK_DEVICE_ID, "low_salt_alert", MOCK_DEVICE_NAME
+    )
+    assert first._attr_name is second._attr_name
+
+    for prop_name in BINARY_SENSOR_DESCRIPTIONS:
+        sensor = HydroLinkBinarySensor(
+            mock_coordinator, MOCK_DEVICE_ID, prop_name, MOCK_DEVICE_NAME
+        )
+        assert sensor._attr_entity_registry_enabled_default == (
+            prop_name in DEFAULT_ENABLED_SENSORS
+        )
+
+def test_binary_sensor_properties_match_descriptions():
+    """Test the shared binary property set lists exactly the described properties."""
+    assert set(BINARY_SENSOR_DESCRIPTIONS) == BINARY_SENSOR_PROPERTIES
+
+def test_binary_sensor_is_on(mock_coordinator):
+    """Test raw flag values are mapped to on/off."""
+    def is_on(prop_name):
+        return HydroLinkBinarySensor(
+            mock_coordinator, MOCK_DEVICE_ID, prop_name, MOCK_DEVICE_NAME
+        ).is_on
+
+    assert is_on("_internal_is_online") is True
+    assert is_on("low_salt_alert") is True
+    assert is_on("floor_leak_detector_alert") is False
+    assert is_on("vacation_mode") is None
+
+def test_binary_sensor_skips_unchanged_state_writes(mock_coordinator):
+    """Test coordinator updates only write state when the flag changes."""
+    sensor = HydroLinkBinarySensor(
+        mock_coordinator, MOCK_DEVICE_ID, "low_salt_alert", MOCK_DEVICE_NAME
+    )
+    sensor.async_write_ha_state = Mock()
+
+    sensor._handle_coordinator_update()
+    sensor._handle_coordinator_update()
+    assert sensor.async_write_ha_state.call_count == 1
+
+    mock_coordinator.values[(MOCK_DEVICE_ID, "low_salt_alert")] = 0
+    sensor._handle_coordinator_update()
+    assert sensor.async_write_ha_state.call_count == 2
+    assert sensor.is_on is False
+
+async def test_async_setup_entry_splits_platforms(hass: HomeAssistant, mock_coordinator):
+    """Test on/off properties go to binary_sensor and the rest to sensor."""
+    mock_entry = Mock()
+    hass.data = {"hydrolink": {mock_entry.entry_id: mock_coordinator}}
+
+    add_binary_sensors = Mock()
+    await async_setup_entry(hass, mock_entry, add_binary_sensors)
+    binary_sensors = add_binary_sensors.call_args[0][0]
+    assert {entity._property_name for entity in binary_sensors} == {
+        "_internal_is_online",
+        "low_salt_alert",
+        "floor_leak_detector_alert",
+        "vacation_mode",
+    }
+
+    add_sensors = Mock()
+    await async_setup_sensor_entry(hass, mock_entry, add_sensors)
+    sensors = add_sensors.call_args[0][0]
+    assert [entity._property_name for entity in sensors] == ["salt_level_tenths"]
@@ -1,6 +1,5 @@
 """Test the config flow."""
 from unittest.mock import AsyncMock, Mock, patch
-import pytest
 from homeassistant import config_entries, data_entry_flow
 from custom_components.hydrolink.const import DOMAIN
 from custom_components.hydrolink.config_flow import ConfigFlow
@@ -31,7 +30,6 @@ def setup_mock_flow():
     
     return flow
 
-@pytest.mark.asyncio
 async def test_form():
     """Test showing the form."""
     flow = setup_mock_flow()
@@ -40,7 +38,6 @@ async def test_form():
     assert result["type"] == data_entry_flow.FlowResultType.FORM
     assert result["step_id"] == "user"
 
-@pytest.mark.asyncio
 async def test_user_input_validation():
     """Test input validation."""
     flow = setup_mock_flow()
@@ -55,7 +52,6 @@ async def test_user_input_validation():
     assert result["type"] == data_entry_flow.FlowResultType.FORM
     assert result["errors"] == {"base": "invalid_auth"}
 
-@pytest.mark.asyncio
 async def test_successful_config_flow():
     """Test a successful config flow."""
     flow = setup_mock_flow()
@@ -92,7 +88,6 @@ async def test_successful_config_flow():
         "password": MOCK_PASSWORD,
     }
 
-@pytest.mark.asyncio
 async def test_failed_config_flow_invalid_auth():
     """Test a failed config flow due to invalid auth."""
     flow = setup_mock_flow()
@@ -114,7 +109,6 @@ async def test_failed_config_flow_invalid_auth():
     assert result["type"] == data_entry_flow.FlowResultType.FORM
     assert result["errors"] == {"base": "invalid_auth"}
 
-@pytest.mark.asyncio
 async def test_failed_config_flow_cannot_connect():
     """Test a failed config flow due to connection error."""
     flow = setup_mock_flow()
@@ -7,52 +7,29 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.update_coordinator import UpdateFailed
 
-from custom_components.hydrolink.coordinator import HydroLinkDataUpdateCoordinator
-from custom_components.hydrolink.const import DOMAIN
+from custom_components.hydrolink.coordinator import (
+    HydroLinkDataUpdateCoordinator,
+    index_property_values,
+)
 from custom_components.hydrolink.api import HydroLinkApi, CannotConnect, InvalidAuth, Device
 
 # Test data
-MOCK_CONFIG = {
-    "email": "test@example.com",
-    "password": "password123"
-}
-
 MOCK_DEVICE_DATA = {
-    "deviceId": "test_device_id",
+    "id": "test_device_id",
     "deviceName": "Test Water Softener",
     "currentWaterFlow": 1.5,
     "saltLevel": 75.5,
     "onlineStatus": True
 }
 
-@pytest.fixture
-def mock_config_entry() -> ConfigEntry:
-    """Create a mock config entry."""
-    # Handle different Home Assistant versions that may or may not require discovery_keys
-    try:
-        return ConfigEntry(
-            version=1,
-            minor_version=1,
-            domain=DOMAIN,
-            title="HydroLink Test",
-            data=MOCK_CONFIG,
-            source="user",
-            options={},
-            unique_id="test@example.com",
-            discovery_keys=None
-        )
-    except TypeError:
-        # Fallback for older HA versions that don't support discovery_keys
-        return ConfigEntry(
-            version=1,
-            minor_version=1,
-            domain=DOMAIN,
-            title="HydroLink Test",
-            data=MOCK_CONFIG,
-            source="user",
-            options={},
-            unique_id="test@example.com"
-        )
+@pytest.fixture(autouse=True)
+def sync_executor(hass: HomeAssistant):
+    """Run executor jobs inline so API calls and their errors reach the coordinator."""
+    async def mock_executor_job(func, *args):
+        return func(*args)
+
+    hass.async_add_executor_job = mock_executor_job
+    return mock_executor_job
 
 @pytest.fixture
 def mock_api():
@@ -62,7 +39,6 @@ def mock_api():
     api.get_data = Mock(return_value=[MOCK_DEVICE_DATA])
     return api
 
-@pytest.mark.asyncio
 async def test_coordinator_initialization(hass: HomeAssistant, mock_config_entry: ConfigEntry):
     """Test coordinator initialization."""
     coordinator = HydroLinkDataUpdateCoordinator(hass, mock_config_entry)
@@ -70,22 +46,15 @@ async def test_coordinator_initialization(hass: HomeAssistant, mock_config_entry
     assert coordinator.hass == hass
     assert coordinator.config_entry == mock_config_entry
     assert coordinator.update_interval == timedelta(minutes=5)
-    assert coordinator.api.email == MOCK_CONFIG["email"]
-    assert coordinator.api.password == MOCK_CONFIG["password"]
+    assert coordinator.api.email == mock_config_entry.data["email"]
+    assert coordinator.api.password == mock_config_entry.data["password"]
 
 
-@pytest.mark.asyncio
 async def test_coordinator_update_success(hass: HomeAssistant, mock_config_entry: ConfigEntry, mock_api):
     """Test successful coordinator data update."""
     coordinator = HydroLinkDataUpdateCoordinator(hass, mock_config_entry)
     coordinator.api = mock_api
     
-    # Mock the async executor job
-    async def mock_executor_job(func):
-        return func()
-    
-    hass.async_add_executor_job = mock_executor_job
-    
     data = await coordinator._async_update_data()
     
     assert len(data) == 1
@@ -94,84 +63,50 @@ async def test_coordinator_update_success(hass: HomeAssistant, mock_config_entry
     mock_api.get_data.assert_called_once()
 
 
-@pytest.mark.asyncio
-async def test_coordinator_update_auth_failure(hass: HomeAssistant, mock_config_entry: ConfigEntry, mock_api):
-    """Test coordinator data update with authentication failure."""
+@pytest.mark.parametrize(
+    "method,error,expected",
+    [
+        ("login", InvalidAuth("Invalid credentials"), ConfigEntryAuthFailed),
+        ("login", CannotConnect("Network error"), UpdateFailed),
+        ("login", Exception("Unexpected error"), UpdateFailed),
+        ("get_data", InvalidAuth("Authentication expired"), ConfigEntryAuthFailed),
+        ("get_data", CannotConnect("API error"), UpdateFailed),
+    ],
+)
+async def test_coordinator_update_errors(
+    hass: HomeAssistant, mock_config_entry: ConfigEntry, mock_api, method, error, expected
+):
+    """Test API failures during a coordinator data update."""
     coordinator = HydroLinkDataUpdateCoordinator(hass, mock_config_entry)
     coordinator.api = mock_api
-    
-    # Mock login failure
-    mock_api.login.side_effect = InvalidAuth("Invalid credentials")
-    
-    # Mock the async executor job
-    async def mock_executor_job(func):
-        return func()
-    
-    hass.async_add_executor_job = mock_executor_job
-    
-    with pytest.raises(ConfigEntryAuthFailed):
-        await coordinator._async_update_data()
 
+    # Fail the given API call; login succeeds when get_data is the one failing
+    getattr(mock_api, method).side_effect = error
 
-@pytest.mark.asyncio
-async def test_coordinator_update_connection_failure(hass: HomeAssistant, mock_config_entry: ConfigEntry, mock_api):
-    """Test coordinator data update with connection failure."""
-    coordinator = HydroLinkDataUpdateCoordinator(hass, mock_config_entry)
-    coordinator.api = mock_api
-    
-    # Mock connection failure
-    mock_api.login.side_effect = CannotConnect("Network error")
-    
-    # Mock the async executor job
-    async def mock_executor_job(func):
-        return func()
-    
-    hass.async_add_executor_job = mock_executor_job
-    
-    with pytest.raises(UpdateFailed):
+    with pytest.raises(expected):
         await coordinator._async_update_data()
 
 
-@pytest.mark.asyncio
-async def test_coordinator_update_generic_exception(hass: HomeAssistant, mock_config_entry: ConfigEntry, mock_api):
-    """Test coordinator data update with generic exception."""
+async def test_coordinator_logs_in_again_after_auth_failure(
+    hass: HomeAssistant, mock_config_entry: ConfigEntry, mock_api
+):
+    """Test login runs once and again only after the credentials are rejected."""
     coordinator = HydroLinkDataUpdateCoordinator(hass, mock_config_entry)
     coordinator.api = mock_api
-    
-    # Mock generic exception
-    mock_api.login.side_effect = Exception("Unexpected error")
-    
-    # Mock the async executor job
-    async def mock_executor_job(func):
-        return func()
-    
-    hass.async_add_executor_job = mock_executor_job
-    
-    with pytest.raises(UpdateFailed):
-        await coordinator._async_update_data()
 
+    await coordinator._async_update_data()
+    await coordinator._async_update_data()
+    mock_api.login.assert_called_once()
 
-@pytest.mark.asyncio
-async def test_coordinator_get_data_failure(hass: HomeAssistant, mock_config_entry: ConfigEntry, mock_api):
-    """Test coordinator when get_data fails after successful login."""
-    coordinator = HydroLinkDataUpdateCoordinator(hass, mock_config_entry)
-    coordinator.api = mock_api
-    
-    # Login succeeds but get_data fails
-    mock_api.login.return_value = True
-    mock_api.get_data.side_effect = CannotConnect("API error")
-    
-    # Mock the async executor job
-    async def mock_executor_job(func):
-        return func()
-    
-    hass.async_add_executor_job = mock_executor_job
-    
-    with pytest.raises(UpdateFailed):
+    mock_api.get_data.side_effect = InvalidAuth("Authentication expired")
+    with pytest.raises(ConfigEntryAuthFailed):
         await coordinator._async_update_data()
 
+    mock_api.get_data.side_effect = None
+    await coordinator._async_update_data()
+    assert mock_api.login.call_count == 2
+
 
-@pytest.mark.asyncio
 async def test_coordinator_empty_devices_list(hass: HomeAssistant, mock_config_entry: ConfigEntry, mock_api):
     """Test coordinator when API returns empty devices list."""
     coordinator = HydroLinkDataUpdateCoordinator(hass, mock_config_entry)
@@ -180,14 +115,37 @@ async def test_coordinator_empty_devices_list(hass: HomeAssistant, mock_config_e
     # Mock empty devices list
     mock_api.get_data.return_value = []
     
-    # Mock the async executor job
-    async def mock_executor_job(func):
-        return func()
-    
-    hass.async_add_executor_job = mock_executor_job
-    
     data = await coordinator._async_update_data()
     
     assert data == []
     mock_api.login.assert_called_once()
-    mock_api.get_data.assert_called_once()
\ No newline at end of file
+    mock_api.get_data.assert_called_once()
+
+
+async def test_coordinator_indexes_property_values(hass: HomeAssistant, mock_config_entry: ConfigEntry, mock_api):
+    """Test the latest fetch is flattened into (device ID, property) values."""
+    coordinator = HydroLinkDataUpdateCoordinator(hass, mock_config_entry)
+    coordinator.api = mock_api
+    assert coordinator.values == {}
+
+    mock_api.get_data.return_value = [
+        {"id": "device_1", "properties": {"salt_level_tenths": {"value": 750}}},
+        {"id": "device_2", "properties": {"model_description": {"value": "ETSS"}}},
+    ]
+
+    await coordinator._async_update_data()
+    assert coordinator.values == {
+        ("device_1", "salt_level_tenths"): 750,
+        ("device_2", "model_description"): "ETSS",
+    }
+
+def test_index_property_values_skips_malformed_devices(caplog):
+    """Test devices without an ID are logged and null properties are tolerated."""
+    data = [
+        {"properties": {"salt_level_tenths": {"value": 750}}},
+        {"id": "device_1", "properties": None},
+        {"id": "device_2", "properties": {"model_description": {"value": "ETSS"}}},
+    ]
+
+    assert index_property_values(data) == {("device_2", "model_description"): "ETSS"}
+    assert "without an ID" in caplog.text
@@ -1,66 +1,35 @@
 """Unit tests for the HydroLink integration."""
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 import pytest
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers import entity_registry as er
 from custom_components.hydrolink import async_setup_entry, async_unload_entry
-from custom_components.hydrolink.const import DOMAIN
+from custom_components.hydrolink.const import BINARY_SENSOR_PROPERTIES, DOMAIN
 from custom_components.hydrolink.const import PLATFORMS
 
-# Test data
-MOCK_CONFIG = {
-    "email": "test@example.com",
-    "password": "password123"
-}
-
-@pytest.fixture
-def mock_config_entry() -> ConfigEntry:
-    """Create a mock config entry."""
-    # Handle different Home Assistant versions that may or may not require discovery_keys
-    try:
-        return ConfigEntry(
-            version=1,
-            minor_version=1,
-            domain=DOMAIN,
-            title="HydroLink Test",
-            data=MOCK_CONFIG,
-            source="user",
-            options={},
-            unique_id="test@example.com",
-            discovery_keys=None
-        )
-    except TypeError:
-        # Fallback for older HA versions that don't support discovery_keys
-        return ConfigEntry(
-            version=1,
-            minor_version=1,
-            domain=DOMAIN,
-            title="HydroLink Test",
-            data=MOCK_CONFIG,
-            source="user",
-            options={},
-            unique_id="test@example.com"
-        )
-
 @pytest.fixture
-def mock_coordinator(hass: HomeAssistant, mock_config_entry: ConfigEntry) -> Mock:
+def mock_coordinator() -> MagicMock:
     """Create a mock data update coordinator."""
-    from custom_components.hydrolink.coordinator import HydroLinkDataUpdateCoordinator
-    
-    coordinator = HydroLinkDataUpdateCoordinator(hass, mock_config_entry)
-    coordinator.async_setup = Mock(return_value=True)
+    coordinator = MagicMock()
     coordinator.async_config_entry_first_refresh = AsyncMock()
     return coordinator
 
-@pytest.mark.asyncio
-async def test_setup_entry(hass: HomeAssistant, mock_config_entry: ConfigEntry, mock_coordinator: Mock):
+async def test_setup_entry(hass: HomeAssistant, mock_config_entry: ConfigEntry, mock_coordinator: MagicMock):
     """Test setting up the integration."""
-    # Mock the required hass attributes
-    hass.config = Mock()
-    hass.config.config_dir = "/test/config"
     hass.data = {}
-    
-    with patch("custom_components.hydrolink.coordinator.HydroLinkDataUpdateCoordinator", return_value=mock_coordinator):
+    mock_coordinator.data = [{"id": "device_1", "properties": {}}]
+    ent_reg = Mock(spec=er.EntityRegistry)
+    legacy_ids = {
+        "hydrolink_device_1_low_salt_alert": "sensor.test_device_low_salt_alert",
+    }
+    ent_reg.async_get_entity_id.side_effect = (
+        lambda domain, platform, unique_id: legacy_ids.get(unique_id)
+    )
+
+    with patch("custom_components.hydrolink.HydroLinkDataUpdateCoordinator", return_value=mock_coordinator), \
+         patch("custom_components.hydrolink.er.async_get", return_value=ent_reg), \
+         patch("custom_components.hydrolink.services.dr.async_get"):
         result = await async_setup_entry(hass, mock_config_entry)
         
     assert result is True
@@ -69,14 +38,19 @@ async def test_setup_entry(hass: HomeAssistant, mock_config_entry: ConfigEntry,
     assert hass.data[DOMAIN][mock_config_entry.entry_id] == mock_coordinator
     hass.config_entries.async_forward_entry_setups.assert_called_once_with(mock_config_entry, PLATFORMS)
 
-@pytest.mark.asyncio
-async def test_unload_entry(hass: HomeAssistant, mock_config_entry: ConfigEntry, mock_coordinator: Mock):
+    # Only the old sensor entries of binary properties are looked up and removed
+    looked_up = {call.args for call in ent_reg.async_get_entity_id.call_args_list}
+    assert looked_up == {
+        ("sensor", DOMAIN, f"hydrolink_device_1_{prop_name}")
+        for prop_name in BINARY_SENSOR_PROPERTIES
+    }
+    ent_reg.async_remove.assert_called_once_with("sensor.test_device_low_salt_alert")
+
+async def test_unload_entry(hass: HomeAssistant, mock_config_entry: ConfigEntry, mock_coordinator: MagicMock):
     """Test unloading the integration."""
-    # Mock the required hass attributes
-    hass.config = Mock()
-    hass.config.config_dir = "/test/config"
     hass.data = {DOMAIN: {mock_config_entry.entry_id: mock_coordinator}}
     
     result = await async_unload_entry(hass, mock_config_entry)
     assert result is True
-    assert mock_config_entry.entry_id not in hass.data[DOMAIN]
\ No newline at end of file
+    assert mock_config_entry.entry_id not in hass.data[DOMAIN]
+    hass.async_add_executor_job.assert_awaited_once_with(mock_coordinator.api.close)
\ No newline at end of file
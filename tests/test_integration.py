@@ -3,9 +3,10 @@ from unittest.mock import AsyncMock, Mock, patch
 import pytest
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
+import custom_components.hydrolink as hydrolink_pkg
 from custom_components.hydrolink.const import DOMAIN
 from custom_components.hydrolink import async_setup_entry
-from homeassistant.config_entries import ConfigEntry
+from tests.helpers import create_mock_config_entry
 
 # Test data
 MOCK_CONFIG = {
@@ -16,15 +17,13 @@ MOCK_CONFIG = {
     }
 }
 
-@pytest.mark.asyncio
+@pytest.mark.integration
 async def test_setup_and_unload(hass: HomeAssistant):
     """Test setting up and unloading the integration."""
-    import custom_components.hydrolink
-
     # Create a mock integration
     mock_integration = Mock()
-    mock_integration.__name__ = custom_components.hydrolink.__name__
-    mock_integration.__file__ = custom_components.hydrolink.__file__
+    mock_integration.__name__ = hydrolink_pkg.__name__
+    mock_integration.__file__ = hydrolink_pkg.__file__
     mock_integration.DOMAIN = DOMAIN
     mock_integration.async_setup = AsyncMock(return_value=True)
     mock_integration.async_setup_entry = AsyncMock(return_value=True)
@@ -43,13 +42,8 @@ async def test_setup_and_unload(hass: HomeAssistant):
         assert DOMAIN in hass.data
     
     # Create a config entry
-    entry = ConfigEntry(
-        version=1,
-        domain=DOMAIN,
-        title="HydroLink Test",
-        data=MOCK_CONFIG["data"],
-        source="user",
-        unique_id="test@example.com"
+    entry = create_mock_config_entry(
+        DOMAIN, MOCK_CONFIG["data"], unique_id="test@example.com"
     )
     
     # Set up entry
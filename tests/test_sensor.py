@@ -1,19 +1,24 @@
 """Unit tests for the HydroLink sensor platform."""
-from unittest.mock import Mock, patch
+import ast
+import inspect
+from types import SimpleNamespace
+from unittest.mock import Mock
 import pytest
 from homeassistant.core import HomeAssistant
-from homeassistant.const import (
-    PERCENTAGE,
-    UnitOfPressure,
-    UnitOfTemperature,
-    UnitOfVolume,
-    UnitOfTime,
-)
+from custom_components.hydrolink import binary_sensor as binary_sensor_module
+from custom_components.hydrolink import const as const_module
+from custom_components.hydrolink import sensor as sensor_module
+from custom_components.hydrolink.coordinator import index_property_values
+from custom_components.hydrolink.entity import _device_info, _entity_name
 from custom_components.hydrolink.sensor import (
     HydroLinkSensor,
     async_setup_entry,
     DEFAULT_ENABLED_SENSORS,
+    SENSOR_CATEGORIES,
     SENSOR_DESCRIPTIONS,
+    SensorCategory,
+    _SENSOR_PLANS,
+    _undescribed_plan,
 )
 
 # Test data
@@ -34,6 +39,7 @@ def mock_coordinator():
             }
         }
     ]
+    coordinator.values = index_property_values(coordinator.data)
     return coordinator
 
 @pytest.fixture
@@ -56,71 +62,47 @@ def test_sensor_native_value(sensor):
     """Test sensor value retrieval."""
     assert sensor.native_value == MOCK_VALUE
 
-def test_sensor_tenths_conversion():
-    """Test that sensors ending in _tenths are divided by 10."""
-    coordinator = Mock()
-    coordinator.data = [
-        {
-            "id": MOCK_DEVICE_ID,
-            "properties": {
-                "salt_level_tenths": {"value": 750},
-                "iron_level_tenths_ppm": {"value": 25},
-                "tlc_avg_temp_tenths_c": {"value": 310},
-            }
-        }
-    ]
-    
-    salt_sensor = HydroLinkSensor(coordinator, MOCK_DEVICE_ID, "salt_level_tenths", MOCK_DEVICE_NAME)
-    assert salt_sensor.native_value == 75.0
-    
-    iron_sensor = HydroLinkSensor(coordinator, MOCK_DEVICE_ID, "iron_level_tenths_ppm", MOCK_DEVICE_NAME)
-    assert iron_sensor.native_value == 2.5
-    
-    temp_sensor = HydroLinkSensor(coordinator, MOCK_DEVICE_ID, "tlc_avg_temp_tenths_c", MOCK_DEVICE_NAME)
-    assert temp_sensor.native_value == 31.0
+def make_coordinator(properties):
+    """Create a lightweight coordinator holding one device's properties."""
+    data = [{"id": MOCK_DEVICE_ID, "properties": properties}]
+    return SimpleNamespace(data=data, values=index_property_values(data))
 
-def test_sensor_capacity_remaining_conversion():
-    """Test that capacity_remaining_percent is divided by 10."""
-    coordinator = Mock()
-    coordinator.data = [
-        {
-            "id": MOCK_DEVICE_ID,
-            "properties": {
-                "capacity_remaining_percent": {"value": 850},
-            }
-        }
-    ]
-    
-    sensor = HydroLinkSensor(coordinator, MOCK_DEVICE_ID, "capacity_remaining_percent", MOCK_DEVICE_NAME)
-    assert sensor.native_value == 85.0
+@pytest.mark.parametrize(
+    "property_name,raw_value,expected",
+    [
+        # Properties ending in _tenths are divided by 10
+        ("salt_level_tenths", 750, 75.0),
+        ("iron_level_tenths_ppm", 25, 2.5),
+        ("tlc_avg_temp_tenths_c", 310, 31.0),
+        # capacity_remaining_percent is also reported in tenths
+        ("capacity_remaining_percent", 850, 85.0),
+        # Salt values are divided by 1000 (API sends in milligrams)
+        ("avg_salt_per_regen_lbs", 6670, 6.67),
+        ("total_salt_use_lbs", 667000, 667.0),
+    ],
+)
+def test_sensor_value_conversion(property_name, raw_value, expected):
+    """Test raw API values are scaled to their display units."""
+    coordinator = make_coordinator({property_name: {"value": raw_value}})
+    sensor = HydroLinkSensor(coordinator, MOCK_DEVICE_ID, property_name, MOCK_DEVICE_NAME)
+    assert sensor.native_value == expected
 
-def test_sensor_salt_values_conversion():
-    """Test that salt values are divided by 1000 (API sends in milligrams)."""
-    coordinator = Mock()
-    coordinator.data = [
-        {
-            "id": MOCK_DEVICE_ID,
-            "properties": {
-                "avg_salt_per_regen_lbs": {"value": 6670},
-                "total_salt_use_lbs": {"value": 667000},
-            }
-        }
-    ]
-    
-    avg_sensor = HydroLinkSensor(coordinator, MOCK_DEVICE_ID, "avg_salt_per_regen_lbs", MOCK_DEVICE_NAME)
-    assert avg_sensor.native_value == 6.67
-    
-    total_sensor = HydroLinkSensor(coordinator, MOCK_DEVICE_ID, "total_salt_use_lbs", MOCK_DEVICE_NAME)
-    assert total_sensor.native_value == 667.0
-
-def test_sensor_attributes(sensor):
-    """Test sensor attributes from descriptions."""
-    description = SENSOR_DESCRIPTIONS.get(MOCK_PROPERTY)
-    if description:
-        assert sensor._attr_native_unit_of_measurement == description.get("unit")
-        assert sensor._attr_device_class == description.get("device_class")
-        assert sensor._attr_state_class == description.get("state_class")
-        assert sensor._attr_icon == description.get("icon")
+@pytest.mark.parametrize("property_name", sorted(SENSOR_DESCRIPTIONS))
+def test_sensor_attributes(mock_coordinator, property_name):
+    """Test sensor attributes come from the property's description."""
+    description = SENSOR_DESCRIPTIONS[property_name]
+    sensor = HydroLinkSensor(mock_coordinator, MOCK_DEVICE_ID, property_name, MOCK_DEVICE_NAME)
+    assert (
+        sensor._attr_native_unit_of_measurement,
+        sensor._attr_device_class,
+        sensor._attr_state_class,
+        sensor._attr_icon,
+    ) == (
+        description.unit,
+        description.device_class,
+        description.state_class,
+        description.icon,
+    )
 
 def test_sensor_unique_id(sensor):
     """Test sensor unique ID generation."""
@@ -139,7 +121,6 @@ def test_sensor_default_enabled(sensor):
         sensor._property_name in DEFAULT_ENABLED_SENSORS
     )
 
-@pytest.mark.asyncio
 async def test_async_setup_entry(hass: HomeAssistant):
     """Test platform setup."""
     mock_entry = Mock()
@@ -155,10 +136,8 @@ async def test_async_setup_entry(hass: HomeAssistant):
             }
         }
     ]
+    mock_coordinator.values = index_property_values(mock_coordinator.data)
     
-    # Set up the hass mock properly
-    hass.config = Mock()
-    hass.config.config_dir = "/test/config"
     hass.data = {"hydrolink": {mock_entry.entry_id: mock_coordinator}}
     
     # Create the async_add_entities mock
@@ -168,4 +147,120 @@ async def test_async_setup_entry(hass: HomeAssistant):
     # Verify entities were created and added
     assert async_add_entities.called
     entities = async_add_entities.call_args[0][0]
-    assert len(entities) == 2  # Two properties in mock data
\ No newline at end of file
+    assert len(entities) == 2  # Two properties in mock data
+
+def test_sensor_skips_unchanged_state_writes(sensor, mock_coordinator):
+    """Test coordinator updates only write state when the value changes."""
+    sensor.async_write_ha_state = Mock()
+
+    sensor._handle_coordinator_update()
+    assert sensor.async_write_ha_state.call_count == 1
+
+    # Same data again - no new state write
+    sensor._handle_coordinator_update()
+    assert sensor.async_write_ha_state.call_count == 1
+
+    # Value changes - state is written
+    mock_coordinator.values[(MOCK_DEVICE_ID, MOCK_PROPERTY)] = MOCK_VALUE + 1
+    sensor._handle_coordinator_update()
+    assert sensor.async_write_ha_state.call_count == 2
+
+def test_sensor_value_refreshed_on_update(sensor, mock_coordinator):
+    """Test native_value is only recomputed on a coordinator update."""
+    sensor.async_write_ha_state = Mock()
+    assert sensor.native_value == MOCK_VALUE
+
+    # Data changes without a coordinator update - stored value is served
+    mock_coordinator.values[(MOCK_DEVICE_ID, MOCK_PROPERTY)] = MOCK_VALUE + 1
+    assert sensor.native_value == MOCK_VALUE
+
+    sensor._handle_coordinator_update()
+    assert sensor.native_value == MOCK_VALUE + 1
+
+def test_sensor_name_shared_across_instances(mock_coordinator):
+    """Test entity names are formatted once and shared between instances."""
+    first = HydroLinkSensor(mock_coordinator, MOCK_DEVICE_ID, "salt_level_tenths", MOCK_DEVICE_NAME)
+    second = HydroLinkSensor(mock_coordinator, MOCK_DEVICE_ID, "salt_level_tenths", MOCK_DEVICE_NAME)
+    assert first._attr_name == f"{MOCK_DEVICE_NAME} Salt Level"
+    assert first._attr_name is second._attr_name
+
+    unknown = HydroLinkSensor(mock_coordinator, MOCK_DEVICE_ID, MOCK_PROPERTY, MOCK_DEVICE_NAME)
+    assert unknown._attr_name == f"{MOCK_DEVICE_NAME} Water Usage Today"
+
+def test_undescribed_sensor_plan_resolved_once(mock_coordinator):
+    """Test properties without a description are planned once, not per entity."""
+    _undescribed_plan.cache_clear()
+    HydroLinkSensor(mock_coordinator, MOCK_DEVICE_ID, MOCK_PROPERTY, MOCK_DEVICE_NAME)
+    HydroLinkSensor(mock_coordinator, MOCK_DEVICE_ID, MOCK_PROPERTY, MOCK_DEVICE_NAME)
+    cache_info = _undescribed_plan.cache_info()
+    assert (cache_info.misses, cache_info.hits) == (1, 1)
+
+def test_sensor_lookup_tables_are_read_only():
+    """Test the module-level lookup tables cannot be mutated at runtime."""
+    for table in (SENSOR_DESCRIPTIONS, SENSOR_CATEGORIES, _SENSOR_PLANS):
+        with pytest.raises(TypeError):
+            table["new_property"] = None
+
+def test_sensor_unknown_numeric_value():
+    """Test "unknown" is reported as None only for numeric device classes."""
+    coordinator = make_coordinator({
+        "tlc_avg_temp_tenths_c": {"value": "unknown"},
+        "model_description": {"value": "unknown"},
+    })
+
+    temp_sensor = HydroLinkSensor(coordinator, MOCK_DEVICE_ID, "tlc_avg_temp_tenths_c", MOCK_DEVICE_NAME)
+    assert temp_sensor.native_value is None
+
+    model_sensor = HydroLinkSensor(coordinator, MOCK_DEVICE_ID, "model_description", MOCK_DEVICE_NAME)
+    assert model_sensor.native_value == "unknown"
+
+def test_sensor_missing_property(sensor, mock_coordinator):
+    """Test a property missing from the latest payload reads as None."""
+    sensor.async_write_ha_state = Mock()
+    mock_coordinator.values = {}
+    sensor._handle_coordinator_update()
+    assert sensor.native_value is None
+
+def test_sensor_device_info_shared(mock_coordinator):
+    """Test sensors on the same device share one device_info dict."""
+    first = HydroLinkSensor(mock_coordinator, MOCK_DEVICE_ID, "salt_level_tenths", MOCK_DEVICE_NAME)
+    second = HydroLinkSensor(mock_coordinator, MOCK_DEVICE_ID, MOCK_PROPERTY, MOCK_DEVICE_NAME)
+    assert first.device_info is second.device_info
+
+def test_shared_entity_caches_are_bounded():
+    """Test the name and device info caches cannot grow without limit."""
+    assert _entity_name.cache_info().maxsize is not None
+    assert _device_info.cache_info().maxsize is not None
+
+def test_sensor_categories_are_flags():
+    """Test every description uses a known category usable as a bit flag."""
+    for description in SENSOR_DESCRIPTIONS.values():
+        assert description.category in SENSOR_CATEGORIES
+
+    water_or_salt = SensorCategory.WATER | SensorCategory.SALT
+    assert SENSOR_DESCRIPTIONS["salt_level_tenths"].category & water_or_salt
+    assert not SENSOR_DESCRIPTIONS["nickname"].category & water_or_salt
+
+@pytest.mark.parametrize(
+    "module", [sensor_module, binary_sensor_module, const_module]
+)
+def test_sensor_tables_have_no_duplicate_keys(module):
+    """Test no literal silently overrides or concatenates a property key."""
+    source = inspect.getsource(module)
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Dict):
+            elts = node.keys
+        elif isinstance(node, ast.Set):
+            elts = node.elts
+        else:
+            continue
+        keys = [elt for elt in elts if isinstance(elt, ast.Constant)]
+        values = [key.value for key in keys]
+        assert len(values) == len(set(values)), f"duplicate keys on line {node.lineno}"
+        for key in keys:
+            if isinstance(key.value, str):
+                # A missing comma joins neighbouring literals into one key
+                segment = ast.get_source_segment(source, key)
+                assert segment.strip("\"'") == key.value, (
+                    f"implicit string concatenation on line {key.lineno}"
+                )
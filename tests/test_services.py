@@ -13,19 +13,30 @@ from custom_components.hydrolink.api import CannotConnect, InvalidAuth
 
 @pytest.fixture
 def mock_device_registry():
-    """Create a mock device registry."""
+    """Create a mock device registry that knows no devices yet."""
     registry = Mock(spec=dr.DeviceRegistry)
+    registry.async_get.return_value = None
     return registry
 
 
 @pytest.fixture
 def mock_device_entry():
-    """Create a mock device registry entry."""
-    entry = Mock()
-    entry.config_entry_id = "test_config_entry_id"
+    """Create a mock device registry entry owned by the test config entry."""
+    entry = Mock(spec=dr.DeviceEntry)
+    entry.config_entries = {"test_config_entry_id"}
     return entry
 
 
+@pytest.fixture
+def patched_device_registry(mock_device_registry):
+    """Make the services use the mock device registry."""
+    with patch(
+        'custom_components.hydrolink.services.dr.async_get',
+        return_value=mock_device_registry,
+    ):
+        yield mock_device_registry
+
+
 @pytest.fixture
 def mock_coordinator():
     """Create a mock coordinator with API."""
@@ -35,10 +46,10 @@ def mock_coordinator():
     return coordinator
 
 
-@pytest.mark.asyncio
 async def test_async_setup_services(hass):
     """Test service setup."""
     hass.services = Mock()
+    hass.services.has_service = Mock(return_value=False)
     hass.services.async_register = Mock()
 
     await async_setup_services(hass)
@@ -53,131 +64,118 @@ async def test_async_setup_services(hass):
     assert isinstance(call_args[1]['schema'], vol.Schema)
 
 
-@pytest.mark.asyncio
-async def test_trigger_regeneration_success(hass, mock_device_registry, mock_device_entry, mock_coordinator):
+async def test_async_setup_services_already_registered(hass):
+    """Test a second config entry does not register the service again."""
+    hass.services = Mock()
+    hass.services.has_service = Mock(return_value=True)
+    hass.services.async_register = Mock()
+
+    await async_setup_services(hass)
+
+    hass.services.has_service.assert_called_once_with(DOMAIN, SERVICE_TRIGGER_REGENERATION)
+    hass.services.async_register.assert_not_called()
+
+
+async def _setup_service_handler(hass):
+    """Set up the services and return the registered regeneration handler."""
+    await async_setup_services(hass)
+    return hass.services.async_register.call_args[0][2]
+
+
+async def test_trigger_regeneration_success(hass, patched_device_registry, mock_device_entry, mock_coordinator):
     """Test successful regeneration trigger."""
     device_id = "test_device_id"
-    
-    # Setup mocks
-    with patch('custom_components.hydrolink.services.dr.async_get', return_value=mock_device_registry):
-        with patch('custom_components.hydrolink.services.dr.async_entries_for_device_id', return_value=[mock_device_entry]):
-            hass.data = {DOMAIN: {"test_config_entry_id": mock_coordinator}}
-            hass.async_add_executor_job = AsyncMock()
-            
-            await async_setup_services(hass)
-            
-            # Get the registered service function
-            service_call = hass.services.async_register.call_args[0][2]
-            
-            # Create a service call
-            call = ServiceCall(DOMAIN, SERVICE_TRIGGER_REGENERATION, {ATTR_DEVICE_ID: device_id})
-            
-            # Execute the service
-            await service_call(call)
-            
-            # Verify the API method was called
-            hass.async_add_executor_job.assert_called_once()
-
-
-@pytest.mark.asyncio
-async def test_trigger_regeneration_device_not_found(hass, mock_device_registry):
+    patched_device_registry.async_get.return_value = mock_device_entry
+    hass.data = {DOMAIN: {"test_config_entry_id": mock_coordinator}}
+    hass.async_add_executor_job = AsyncMock()
+
+    service_call = await _setup_service_handler(hass)
+    call = ServiceCall(DOMAIN, SERVICE_TRIGGER_REGENERATION, {ATTR_DEVICE_ID: device_id})
+    await service_call(call)
+
+    # Verify the API method was called for the device
+    patched_device_registry.async_get.assert_called_once_with(device_id)
+    hass.async_add_executor_job.assert_called_once_with(
+        mock_coordinator.api.trigger_regeneration, device_id
+    )
+
+
+async def test_trigger_regeneration_device_not_found(hass, patched_device_registry):
     """Test regeneration trigger with device not found."""
     device_id = "nonexistent_device_id"
-    
-    # Setup mocks
-    with patch('custom_components.hydrolink.services.dr.async_get', return_value=mock_device_registry):
-        with patch('custom_components.hydrolink.services.dr.async_entries_for_device_id', return_value=[]):
-            await async_setup_services(hass)
-            
-            # Get the registered service function
-            service_call = hass.services.async_register.call_args[0][2]
-            
-            # Create a service call
-            call = ServiceCall(DOMAIN, SERVICE_TRIGGER_REGENERATION, {ATTR_DEVICE_ID: device_id})
-            
-            # Execute the service and expect an error
-            with pytest.raises(ValueError, match=f"Device {device_id} not found"):
-                await service_call(call)
-
-
-@pytest.mark.asyncio
-async def test_trigger_regeneration_no_config_entry(hass, mock_device_registry):
-    """Test regeneration trigger with no config entry."""
+
+    service_call = await _setup_service_handler(hass)
+    call = ServiceCall(DOMAIN, SERVICE_TRIGGER_REGENERATION, {ATTR_DEVICE_ID: device_id})
+
+    with pytest.raises(ValueError, match=f"Device {device_id} not found"):
+        await service_call(call)
+
+
+async def test_trigger_regeneration_no_config_entry(hass, patched_device_registry, mock_device_entry, mock_coordinator):
+    """Test regeneration trigger for a device with no loaded HydroLink entry."""
     device_id = "test_device_id"
-    
-    # Create device entry without config_entry_id
-    mock_device_entry = Mock()
-    mock_device_entry.config_entry_id = None
-    
-    # Setup mocks
-    with patch('custom_components.hydrolink.services.dr.async_get', return_value=mock_device_registry):
-        with patch('custom_components.hydrolink.services.dr.async_entries_for_device_id', return_value=[mock_device_entry]):
-            await async_setup_services(hass)
-            
-            # Get the registered service function
-            service_call = hass.services.async_register.call_args[0][2]
-            
-            # Create a service call
-            call = ServiceCall(DOMAIN, SERVICE_TRIGGER_REGENERATION, {ATTR_DEVICE_ID: device_id})
-            
-            # Execute the service and expect an error
-            with pytest.raises(ValueError, match=f"No config entry found for device {device_id}"):
-                await service_call(call)
-
-
-@pytest.mark.asyncio
-async def test_trigger_regeneration_api_error(hass, mock_device_registry, mock_device_entry, mock_coordinator):
-    """Test regeneration trigger with API error."""
+
+    # The device belongs to another integration's config entry
+    mock_device_entry.config_entries = {"other_config_entry_id"}
+    patched_device_registry.async_get.return_value = mock_device_entry
+    hass.data = {DOMAIN: {"test_config_entry_id": mock_coordinator}}
+
+    service_call = await _setup_service_handler(hass)
+    call = ServiceCall(DOMAIN, SERVICE_TRIGGER_REGENERATION, {ATTR_DEVICE_ID: device_id})
+
+    with pytest.raises(ValueError, match=f"No config entry found for device {device_id}"):
+        await service_call(call)
+
+
+@pytest.mark.parametrize(
+    "error",
+    [CannotConnect("Network error"), InvalidAuth("Authentication failed")],
+)
+async def test_trigger_regeneration_api_error(
+    hass, patched_device_registry, mock_device_entry, mock_coordinator, error
+):
+    """Test regeneration trigger with API errors."""
     device_id = "test_device_id"
-    
-    # Setup mocks
-    with patch('custom_components.hydrolink.services.dr.async_get', return_value=mock_device_registry):
-        with patch('custom_components.hydrolink.services.dr.async_entries_for_device_id', return_value=[mock_device_entry]):
-            hass.data = {DOMAIN: {"test_config_entry_id": mock_coordinator}}
-            
-            # Mock async_add_executor_job to raise an exception
-            async def mock_executor_job(func, *args):
-                raise CannotConnect("Network error")
-            
-            hass.async_add_executor_job = mock_executor_job
-            
-            await async_setup_services(hass)
-            
-            # Get the registered service function
-            service_call = hass.services.async_register.call_args[0][2]
-            
-            # Create a service call
-            call = ServiceCall(DOMAIN, SERVICE_TRIGGER_REGENERATION, {ATTR_DEVICE_ID: device_id})
-            
-            # Execute the service and expect an error
-            with pytest.raises(ValueError, match="Failed to trigger regeneration"):
-                await service_call(call)
-
-
-@pytest.mark.asyncio
-async def test_trigger_regeneration_invalid_auth(hass, mock_device_registry, mock_device_entry, mock_coordinator):
-    """Test regeneration trigger with invalid auth error."""
+    patched_device_registry.async_get.return_value = mock_device_entry
+    hass.data = {DOMAIN: {"test_config_entry_id": mock_coordinator}}
+
+    # Mock async_add_executor_job to raise the API error
+    async def mock_executor_job(func, *args):
+        raise error
+
+    hass.async_add_executor_job = mock_executor_job
+
+    service_call = await _setup_service_handler(hass)
+    call = ServiceCall(DOMAIN, SERVICE_TRIGGER_REGENERATION, {ATTR_DEVICE_ID: device_id})
+
+    with pytest.raises(ValueError, match="Failed to trigger regeneration"):
+        await service_call(call)
+
+
+async def test_trigger_regeneration_caches_config_entry(hass, patched_device_registry, mock_device_entry, mock_coordinator):
+    """Test the device's config entry is resolved once until the registry changes."""
     device_id = "test_device_id"
-    
-    # Setup mocks
-    with patch('custom_components.hydrolink.services.dr.async_get', return_value=mock_device_registry):
-        with patch('custom_components.hydrolink.services.dr.async_entries_for_device_id', return_value=[mock_device_entry]):
-            hass.data = {DOMAIN: {"test_config_entry_id": mock_coordinator}}
-            
-            # Mock async_add_executor_job to raise an InvalidAuth exception
-            async def mock_executor_job(func, *args):
-                raise InvalidAuth("Authentication failed")
-            
-            hass.async_add_executor_job = mock_executor_job
-            
-            await async_setup_services(hass)
-            
-            # Get the registered service function
-            service_call = hass.services.async_register.call_args[0][2]
-            
-            # Create a service call
-            call = ServiceCall(DOMAIN, SERVICE_TRIGGER_REGENERATION, {ATTR_DEVICE_ID: device_id})
-            
-            # Execute the service and expect an error
-            with pytest.raises(ValueError, match="Failed to trigger regeneration"):
-                await service_call(call)
\ No newline at end of file
+    patched_device_registry.async_get.return_value = mock_device_entry
+    hass.data = {DOMAIN: {"test_config_entry_id": mock_coordinator}}
+    hass.async_add_executor_job = AsyncMock()
+
+    service_call = await _setup_service_handler(hass)
+    call = ServiceCall(DOMAIN, SERVICE_TRIGGER_REGENERATION, {ATTR_DEVICE_ID: device_id})
+
+    await service_call(call)
+    await service_call(call)
+    assert patched_device_registry.async_get.call_count == 1
+
+    # A device registry update invalidates the cache
+    event_type, clear_cache = hass.bus.async_listen.call_args[0]
+    assert event_type == dr.EVENT_DEVICE_REGISTRY_UPDATED
+    clear_cache(Mock())
+    await service_call(call)
+    assert patched_device_registry.async_get.call_count == 2
+
+    # So does unloading the cached config entry
+    hass.data[DOMAIN] = {}
+    with pytest.raises(ValueError, match=f"No config entry found for device {device_id}"):
+        await service_call(call)
+    assert patched_device_registry.async_get.call_count == 3
+    assert hass.async_add_executor_job.call_count == 3